@@ -29,6 +29,10 @@ def main() -> None:
         _cmd_logs(args[1:])
     elif command == "cleanup":
         _cmd_cleanup(args[1:])
+    elif command == "status":
+        _cmd_status(args[1:])
+    elif command == "gc":
+        _cmd_gc(args[1:])
     elif command in ("-h", "--help", "help"):
         _cmd_help()
     elif command in ("-v", "--version", "version"):
@@ -51,6 +55,8 @@ Usage:
   tooltray autostart            Manage system autostart
   tooltray logs                 View log file
   tooltray cleanup              Remove orphaned desktop icons
+  tooltray status               Show installed and remote tool versions
+  tooltray gc                   Free disk space within the disk budget
 
 Setup options:
   --code CODE                   Config code (skip GUI dialog)
@@ -58,6 +64,8 @@ Setup options:
 Encode options:
   --token TOKEN                 GitHub PAT (required)
   --repo ORG/REPO               Repository to include (can be repeated)
+  --org ORG                     Discover repos with tooltray.toml in org (can be repeated)
+  --topic TOPIC                 Only discover org repos with this topic
   --prefix PREFIX               Code prefix for branding (default: TB)
 
 Autostart options:
@@ -73,12 +81,25 @@ Cleanup options:
   --dry-run                     Show what would be removed
   --force                       Remove without confirmation
 
+Status options:
+  --json                        Print machine-readable JSON
+  --only-outdated               Only show tools needing install/update
+  --repo ORG/REPO               Only check this repo (can be repeated)
+  (exits with code 2 when updates are pending)
+
+Gc options:
+  --dry-run                     Show what would be removed
+  --force                       Remove without confirmation
+
 Examples:
   tooltray setup
   tooltray setup --code "TB-eyJ0b2tlbi..."
   tooltray encode --token ghp_xxx --repo myorg/myapp --repo myorg/cli
+  tooltray encode --token ghp_xxx --org myorg
   tooltray autostart --enable
   tooltray cleanup --dry-run
+  tooltray status --json --only-outdated
+  tooltray gc --dry-run
 """)
 
 
@@ -162,8 +183,9 @@ Edit tooltray.toml:
 Optional fields:
   build        - Build command for git type (e.g. "npm install")
   desktop_icon - Set to true to create desktop shortcut
-  autostart    - Set to true to launch on system startup
+  autostart    - Set to true to launch and keep running with tooltray
   icon         - Path to icon file in repo
+  category     - Menu group when tools are grouped by category
 
 Once configured, commit tooltray.toml to your repo.
 """)
@@ -242,7 +264,8 @@ def _cmd_cleanup(args: list[str]) -> None:
 
     from tool_tray.config import load_config
     from tool_tray.desktop import remove_desktop_icon
-    from tool_tray.manifest import fetch_manifest
+    from tool_tray.discovery import iter_config_repos
+    from tool_tray.manifest import fetch_manifests
     from tool_tray.state import load_state, remove_icon_record
 
     dry_run = "--dry-run" in args
@@ -255,15 +278,18 @@ def _cmd_cleanup(args: list[str]) -> None:
         return
 
     token = config.get("token", "")
-    repos = config.get("repos", [])
+    repos = list(
+        iter_config_repos(
+            config.get("repos", []), config.get("orgs", []), token, config.get("topic")
+        )
+    )
     active_repos = set(repos)
 
     # Build manifest lookup for active repos
-    manifest_by_repo: dict[str, bool] = {}  # repo -> desktop_icon enabled
+    icon_by_tool: dict[str, bool] = {}  # tool name -> desktop_icon enabled
     for repo in repos:
-        manifest = fetch_manifest(repo, token)
-        if manifest:
-            manifest_by_repo[repo] = manifest.desktop_icon
+        for manifest in fetch_manifests(repo, token) or []:
+            icon_by_tool[manifest.launch or manifest.name] = manifest.desktop_icon
 
     # Find orphaned icons
     state = load_state()
@@ -276,7 +302,7 @@ def _cmd_cleanup(args: list[str]) -> None:
             orphans.append((tool_name, record.path, "file missing"))
         elif record.repo not in active_repos:
             orphans.append((tool_name, record.path, "repo removed"))
-        elif record.repo in manifest_by_repo and not manifest_by_repo[record.repo]:
+        elif tool_name in icon_by_tool and not icon_by_tool[tool_name]:
             orphans.append((tool_name, record.path, "desktop_icon disabled"))
 
     if not orphans:
@@ -324,6 +350,164 @@ def _cmd_cleanup(args: list[str]) -> None:
     print(f"\nCleaned up {removed} icon(s).")
 
 
+def _cmd_gc(args: list[str]) -> None:
+    from tool_tray.config import load_config
+    from tool_tray.discovery import discovery_cached, load_discovered_repos
+    from tool_tray.storage import collect_garbage, set_disk_budget
+
+    dry_run = "--dry-run" in args
+    force = "--force" in args
+
+    config = load_config()
+    if not config:
+        print("No config found. Run 'tooltray setup' first.")
+        return
+
+    # Only what is known locally: gc never needs the network
+    orgs, topic = config.get("orgs", []), config.get("topic")
+    repos: list[str] | None = None
+    if discovery_cached(orgs, topic):
+        repos = config.get("repos", []) + load_discovered_repos(orgs, topic)
+    else:
+        # Without the discovered repos, any tool might still be configured
+        print("Org repos not discovered yet: installed tools are kept.")
+    set_disk_budget(config.get("disk_budget_mb", 5120))
+
+    def mb(size: int) -> str:
+        return f"{size / (1024 * 1024):.0f} MB"
+
+    plan = collect_garbage(repos, dry_run=True)
+    budget = config.get("disk_budget_mb", 5120) * 1024 * 1024
+    print(f"Disk usage: {mb(plan.total)} of {mb(budget)} budget")
+    print(f"  Installed tools: {mb(plan.live)}")
+    print(f"  Removable: {mb(plan.total - plan.live)}")
+
+    if not plan.evicted:
+        if plan.total > budget:
+            print("\nOver budget, but nothing can be removed.")
+        else:
+            print("\nWithin budget, nothing to remove.")
+        return
+
+    print(f"\nLeast recently used, to remove ({mb(plan.freed)}):\n")
+    for artefact in plan.evicted:
+        print(f"  {artefact.description}  [{artefact.kind}, {mb(artefact.size)}]")
+        print(f"    Path: {artefact.path}")
+
+    if dry_run:
+        print("\nDry run - no changes made.")
+        return
+
+    if not force:
+        try:
+            confirm = input("\nRemove these? [y/N] ").strip().lower()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+
+        if confirm != "y":
+            print("Cancelled")
+            return
+
+    result = collect_garbage(repos)
+    print(f"\nFreed {mb(result.freed)}.")
+
+
+def _cmd_status(args: list[str]) -> None:
+    import json
+    import sys
+
+    from tool_tray.config import load_config
+    from tool_tray.discovery import iter_config_repos
+    from tool_tray.status import fetch_statuses
+
+    as_json = False
+    only_outdated = False
+    only_repos: list[str] = []
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--json":
+            as_json = True
+            i += 1
+        elif arg == "--only-outdated":
+            only_outdated = True
+            i += 1
+        elif arg == "--repo" and i + 1 < len(args):
+            only_repos.append(args[i + 1].strip().strip("'\""))
+            i += 2
+        else:
+            print(f"Unknown option: {arg}")
+            sys.exit(1)
+
+    config = load_config()
+    if not config:
+        print("No config found. Run 'tooltray setup' first.", file=sys.stderr)
+        sys.exit(1)
+
+    token = config.get("token", "")
+    repos = only_repos or iter_config_repos(
+        config.get("repos", []), config.get("orgs", []), token, config.get("topic")
+    )
+
+    errors: dict[str, str] = {}
+    statuses = fetch_statuses(repos, token, errors=errors)
+    pending = any(s.needs_update for s in statuses)
+    if only_outdated:
+        statuses = [s for s in statuses if s.needs_update or s.repo in errors]
+    # Repos that failed without any tool to show still get a row
+    failed = [repo for repo in errors if all(s.repo != repo for s in statuses)]
+
+    if as_json:
+        rows = [
+            {
+                "repo": s.repo,
+                "name": s.name,
+                "type": s.manifest.type,
+                "installed": s.installed,
+                "remote": s.remote,
+                "executable": s.executable,
+                "state": "error" if s.repo in errors else s.state,
+                "error": errors.get(s.repo),
+            }
+            for s in statuses
+        ]
+        rows += [
+            {
+                "repo": repo,
+                "name": None,
+                "type": None,
+                "installed": None,
+                "remote": None,
+                "executable": None,
+                "state": "error",
+                "error": errors[repo],
+            }
+            for repo in failed
+        ]
+        print(json.dumps(rows, indent=2))
+    elif statuses or failed:
+        table = [("TOOL", "REPO", "INSTALLED", "REMOTE", "STATE")]
+        for s in statuses:
+            state = "error" if s.repo in errors else s.state
+            table.append((s.name, s.repo, s.installed or "-", s.remote or "-", state))
+        for repo in failed:
+            table.append(("-", repo, "-", "-", "error"))
+        widths = [max(len(row[col]) for row in table) for col in range(5)]
+        for row in table:
+            print("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+    elif not only_outdated:
+        print("No tools with tooltray.toml")
+
+    for repo, error in errors.items():
+        print(f"Error: {repo}: {error}", file=sys.stderr)
+    if errors:
+        sys.exit(1)
+    if pending:
+        sys.exit(2)
+
+
 def _cmd_encode(args: list[str]) -> None:
     import sys
 
@@ -332,6 +516,8 @@ def _cmd_encode(args: list[str]) -> None:
     token = ""
     prefix = "TB"
     repos: list[str] = []
+    orgs: list[str] = []
+    topic: str | None = None
 
     i = 0
     while i < len(args):
@@ -352,6 +538,12 @@ def _cmd_encode(args: list[str]) -> None:
                 sys.exit(1)
             repos.append(repo)
             i += 2
+        elif arg == "--org" and i + 1 < len(args):
+            orgs.append(args[i + 1].strip().strip("'\""))
+            i += 2
+        elif arg == "--topic" and i + 1 < len(args):
+            topic = args[i + 1].strip().strip("'\"")
+            i += 2
         else:
             print(f"Unknown option: {arg}")
             sys.exit(1)
@@ -360,9 +552,9 @@ def _cmd_encode(args: list[str]) -> None:
         print("Error: --token is required")
         sys.exit(1)
 
-    if not repos:
-        print("Error: at least one --repo is required")
+    if not repos and not orgs:
+        print("Error: at least one --repo or --org is required")
         sys.exit(1)
 
-    code = encode_config(token, repos, prefix)
+    code = encode_config(token, repos, prefix, orgs=orgs, topic=topic)
     print(code)
@@ -0,0 +1,146 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+
+_FAILURE_THRESHOLD: int = 3  # Consecutive failures before the breaker opens
+_BASE_COOLDOWN_SECONDS: int = 120
+_MAX_COOLDOWN_SECONDS: int = 6 * 3600
+_PROBE_TIMEOUT_SECONDS: int = 300  # A probe never reported back is retried
+
+
+@dataclass
+class Breaker:
+    """Failure tracking for one repo operation (e.g. "fetch:org/repo")."""
+
+    key: str
+    state: str = "closed"  # closed | open | half_open
+    failures: int = 0
+    failing_since: float = 0
+    opened_at: float = 0
+    cooldown: float = 0
+    probe_started: float = 0
+
+    @property
+    def failing_text(self) -> str:
+        """Menu hint like "failing since 14:05"."""
+        since = datetime.fromtimestamp(self.failing_since)
+        if since.date() == datetime.now().date():
+            return f"failing since {since:%H:%M}"
+        return f"failing since {since:%b %d}"
+
+
+_breakers: dict[str, Breaker] = {}
+_lock = threading.Lock()
+
+
+def allow(key: str) -> bool:
+    """Check whether an operation may run.
+
+    Open breakers reject calls until their cool-down passes; then exactly one
+    probe call is let through (half-open) to decide whether to close again.
+    Callers must report the probe's outcome; if one never does, another
+    probe is let through after a timeout.
+    """
+    from tool_tray.logging import log_debug
+
+    now = time.time()
+    with _lock:
+        breaker = _breakers.get(key)
+        if breaker is None or breaker.state == "closed":
+            return True
+        if breaker.state == "half_open":
+            # A probe is already in flight, unless it was lost
+            if now - breaker.probe_started < _PROBE_TIMEOUT_SECONDS:
+                return False
+        elif now - breaker.opened_at < breaker.cooldown:
+            return False
+        breaker.state = "half_open"
+        breaker.probe_started = now
+    log_debug(f"Circuit half-open, probing: {key}")
+    return True
+
+
+def record_success(key: str) -> None:
+    """Close the breaker after a successful call."""
+    from tool_tray.logging import log_info
+
+    with _lock:
+        breaker = _breakers.pop(key, None)
+    if breaker and breaker.state != "closed":
+        log_info(f"Circuit closed: {key}")
+
+
+def record_failure(key: str) -> int:
+    """Count a failed call. Returns the number of consecutive failures.
+
+    The breaker opens after several consecutive failures; each failed
+    half-open probe doubles the cool-down.
+    """
+    from tool_tray.logging import log_error
+
+    now = time.time()
+    with _lock:
+        breaker = _breakers.setdefault(key, Breaker(key=key, failing_since=now))
+        breaker.failures += 1
+        if breaker.state == "half_open":
+            breaker.cooldown = min(breaker.cooldown * 2, _MAX_COOLDOWN_SECONDS)
+        elif breaker.failures >= _FAILURE_THRESHOLD and breaker.state == "closed":
+            breaker.cooldown = _BASE_COOLDOWN_SECONDS
+        else:
+            return breaker.failures
+        breaker.state = "open"
+        breaker.opened_at = now
+        failures, cooldown = breaker.failures, breaker.cooldown
+
+    log_error(f"Circuit open: {key} ({failures} failures, retry in {int(cooldown)}s)")
+    return failures
+
+
+@dataclass
+class Attempt:
+    """Outcome of one call let through by allow(); see attempt()."""
+
+    key: str
+    failed: bool = False
+
+    def fail(self) -> int:
+        """Count this call as failed. Returns the consecutive failures."""
+        self.failed = True
+        return record_failure(self.key)
+
+
+@contextmanager
+def attempt(key: str) -> Iterator[Attempt]:
+    """Report the outcome of a call to the breaker, whatever happens.
+
+    The call counts as a success if the block exits normally and as a
+    failure if it raises (the exception propagates) or calls fail(). This
+    way a half-open probe is never left without an outcome.
+    """
+    result = Attempt(key)
+    try:
+        yield result
+    except BaseException:
+        if not result.failed:
+            record_failure(key)
+        raise
+    if not result.failed:
+        record_success(key)
+
+
+def get_breaker(key: str) -> Breaker | None:
+    """Get the breaker for a key if it is open or half-open."""
+    with _lock:
+        breaker = _breakers.get(key)
+        if breaker and breaker.state != "closed":
+            return breaker
+    return None
+
+
+def open_breakers() -> list[Breaker]:
+    """All breakers that are currently open or half-open."""
+    with _lock:
+        return [b for b in _breakers.values() if b.state != "closed"]
@@ -2,6 +2,7 @@ import base64
 import json
 import os
 import sys
+import threading
 from pathlib import Path
 
 
@@ -21,23 +22,67 @@ def get_config_dir() -> Path:
         return Path.home() / ".config/tooltray"
 
 
+def get_cache_dir() -> Path:
+    """Get OS-appropriate cache directory (safe to delete at any time)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+        if base:
+            return Path(base) / "tooltray/cache"
+        return Path.home() / "AppData/Local/tooltray/cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library/Caches/tooltray"
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        if xdg:
+            return Path(xdg) / "tooltray"
+        return Path.home() / ".cache/tooltray"
+
+
+def write_json(path: Path, data: object) -> None:
+    """Write JSON atomically, so readers never see a half-written file.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp name so concurrent writers don't write into the same file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
 def get_config_path() -> Path:
     """Get path to config.json."""
     return get_config_dir() / "config.json"
 
 
-def encode_config(token: str, repos: list[str], prefix: str = "TB") -> str:
+def encode_config(
+    token: str,
+    repos: list[str],
+    prefix: str = "TB",
+    orgs: list[str] | None = None,
+    topic: str | None = None,
+) -> str:
     """Encode token and repos into a shareable config code (v2 format).
 
     Args:
         token: GitHub PAT (ghp_xxx)
         repos: List of "org/repo" strings
         prefix: Code prefix for branding (default: "TB")
+        orgs: Orgs to search for repos containing tooltray.toml
+        topic: Only discover org repos tagged with this topic
 
     Returns:
         Config code like "TB-eyJ0b2tlbi..."
     """
-    data = {"token": token, "repos": repos}
+    data: dict = {"token": token, "repos": repos}
+    if orgs:
+        data["orgs"] = orgs
+    if topic:
+        data["topic"] = topic
     b64 = base64.b64encode(json.dumps(data).encode()).decode()
     return f"{prefix}-{b64}"
 
@@ -49,7 +94,7 @@ def decode_config(code: str) -> dict:
         code: Config code in format "PREFIX-base64data"
 
     Returns:
-        Dict with "token" and "repos" keys
+        Dict with "token" and "repos" keys (plus "orgs"/"topic" if set)
 
     Raises:
         ValueError: If code is invalid
@@ -63,8 +108,9 @@ def decode_config(code: str) -> dict:
     except Exception as e:
         raise ValueError(f"Invalid config code: {e}") from e
 
-    if "token" not in data or "repos" not in data:
+    if "token" not in data or ("repos" not in data and "orgs" not in data):
         raise ValueError("Invalid config code: missing token or repos")
+    data.setdefault("repos", [])
 
     return data
 
@@ -86,7 +132,8 @@ def load_config() -> dict | None:
 
             data["repos"] = [unquote(r).strip().strip("'\"") for r in data["repos"]]
         repos = data.get("repos", [])
-        log_debug(f"Config loaded: {len(repos)} repos")
+        orgs = data.get("orgs", [])
+        log_debug(f"Config loaded: {len(repos)} repos, {len(orgs)} orgs")
         return data
     except (json.JSONDecodeError, OSError) as e:
         log_error(f"Failed to load config: {path}", e)
@@ -4,7 +4,8 @@ import os
 import sys
 from pathlib import Path
 
-from tool_tray.tray import get_tool_executable
+from tool_tray.manifest import Manifest
+from tool_tray.updater import get_tool_executable, get_tool_executables
 
 
 def get_desktop_path() -> Path:
@@ -61,6 +62,23 @@ def remove_desktop_icon(tool_name: str) -> bool:
         return False
 
 
+def _make_shortcut(tool_name: str, exe: str, icon_path: str | None) -> None:
+    """Create the platform shortcut via pyshortcuts."""
+    from pyshortcuts import make_shortcut
+
+    # Suppress stdout - pyshortcuts has debug prints on macOS
+    # noexe=True because uv tool shims are self-contained executables
+    with contextlib.redirect_stdout(io.StringIO()):
+        make_shortcut(
+            str(exe),
+            name=tool_name.replace("-", " ").title(),
+            icon=icon_path,
+            terminal=False,
+            desktop=True,
+            noexe=True,
+        )
+
+
 def create_desktop_icon(
     tool_name: str, icon_path: str | None = None, repo: str | None = None
 ) -> bool:
@@ -69,25 +87,13 @@ def create_desktop_icon(
 
     log_debug(f"Creating desktop icon: {tool_name}")
 
-    from pyshortcuts import make_shortcut
-
     exe = get_tool_executable(tool_name)
     if not exe:
         log_error(f"Tool not found for desktop icon: {tool_name}")
         return False
 
     try:
-        # Suppress stdout - pyshortcuts has debug prints on macOS
-        # noexe=True because uv tool shims are self-contained executables
-        with contextlib.redirect_stdout(io.StringIO()):
-            make_shortcut(
-                str(exe),
-                name=tool_name.replace("-", " ").title(),
-                icon=icon_path,
-                terminal=False,
-                desktop=True,
-                noexe=True,
-            )
+        _make_shortcut(tool_name, exe, icon_path)
         log_info(f"Desktop icon created: {tool_name}")
 
         # Record the icon in state if repo is provided
@@ -95,9 +101,71 @@ def create_desktop_icon(
             from tool_tray.state import record_desktop_icon
 
             icon_file = get_desktop_icon_path(tool_name)
-            record_desktop_icon(tool_name, str(icon_file), repo)
+            record_desktop_icon(tool_name, str(icon_file), repo, exe, icon_path)
 
         return True
     except Exception as e:
         log_error(f"Failed to create desktop icon: {tool_name}", e)
         return False
+
+
+def create_desktop_icons(batch: list[tuple[str, Manifest]], token: str) -> int:
+    """Create desktop icons for a batch of (repo, manifest) after installs.
+
+    Executables are resolved from a single uv inventory, icons whose target
+    and image are unchanged are skipped, and all records are saved in one
+    state write. Returns the number of icons created.
+    """
+    from datetime import datetime
+
+    from tool_tray.icons import fetch_tool_icon
+    from tool_tray.logging import log_debug, log_error, log_info
+    from tool_tray.state import DesktopIconRecord, load_state, record_desktop_icons
+
+    if not batch:
+        return 0
+
+    executables = get_tool_executables()
+    existing = load_state().desktop_icons
+    records: list[DesktopIconRecord] = []
+
+    for repo, manifest in batch:
+        tool_name = manifest.launch or manifest.name
+        icon_path = fetch_tool_icon(repo, manifest, token)
+        exe = executables.get(tool_name)
+        if not exe:
+            log_error(f"Tool not found for desktop icon: {tool_name}")
+            continue
+
+        icon_file = get_desktop_icon_path(tool_name)
+        record = existing.get(tool_name)
+        if (
+            record
+            and record.target == exe
+            and record.icon == icon_path
+            and icon_file.exists()
+        ):
+            log_debug(f"Desktop icon unchanged: {tool_name}")
+            continue
+
+        try:
+            _make_shortcut(tool_name, exe, icon_path)
+        except (OSError, ValueError) as e:
+            log_error(f"Failed to create desktop icon: {tool_name}", e)
+            continue
+
+        records.append(
+            DesktopIconRecord(
+                path=str(icon_file),
+                tool_name=tool_name,
+                created_at=datetime.now().isoformat(),
+                repo=repo,
+                target=exe,
+                icon=icon_path,
+            )
+        )
+
+    record_desktop_icons(records)
+    if records:
+        log_info(f"Desktop icons created: {len(records)}")
+    return len(records)
@@ -0,0 +1,160 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from itertools import chain
+from pathlib import Path
+
+import httpx
+
+from tool_tray.config import get_cache_dir, write_json
+from tool_tray.github import API_URL, iter_pages
+
+_DISCOVERY_TTL_SECONDS: int = 3600
+
+
+def get_discovery_path() -> Path:
+    """Get path to the cached set of discovered repos."""
+    return get_cache_dir() / "discovered.json"
+
+
+def _cache_key(orgs: list[str], topic: str | None) -> str:
+    return ",".join(sorted(o.lower() for o in orgs)) + f"|{topic or ''}"
+
+
+def _load_cache() -> dict:
+    from tool_tray.logging import log_error
+
+    path = get_discovery_path()
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (json.JSONDecodeError, OSError) as e:
+        log_error(f"Failed to load discovery cache: {path}", e)
+        return {}
+
+
+def _save_cache(orgs: list[str], topic: str | None, repos: list[str]) -> None:
+    from tool_tray.logging import log_error
+
+    path = get_discovery_path()
+    data = {
+        "key": _cache_key(orgs, topic),
+        "discovered_at": time.time(),
+        "repos": repos,
+    }
+    try:
+        write_json(path, data)
+    except OSError as e:
+        log_error(f"Failed to save discovery cache: {path}", e)
+
+
+def discovery_cached(orgs: list[str], topic: str | None = None) -> bool:
+    """True if the repos discovered for these orgs are known locally."""
+    return not orgs or _load_cache().get("key") == _cache_key(orgs, topic)
+
+
+def load_discovered_repos(orgs: list[str], topic: str | None = None) -> list[str]:
+    """Get the last discovered repos for these orgs, even if expired."""
+    if not orgs:
+        return []
+    cache = _load_cache()
+    if cache.get("key") != _cache_key(orgs, topic):
+        return []
+    return cache.get("repos", [])
+
+
+def search_org_repos(
+    org: str,
+    token: str,
+    topic: str | None = None,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[str]:
+    """Stream repos in an org that contain tooltray.toml (or carry a topic).
+
+    Without a topic, code search finds repos with tooltray.toml in the root.
+    With a topic, repository search is used instead.
+    """
+    params: dict = {"per_page": 100}
+    if topic:
+        url = f"{API_URL}/search/repositories"
+        params["q"] = f"topic:{topic} org:{org}"
+        for item in iter_pages(url, token, params, "items", deadline, cancel):
+            yield item["full_name"]
+    else:
+        url = f"{API_URL}/search/code"
+        params["q"] = f"filename:tooltray.toml path:/ org:{org}"
+        for item in iter_pages(url, token, params, "items", deadline, cancel):
+            yield item["repository"]["full_name"]
+
+
+def iter_discovered_repos(
+    orgs: list[str],
+    token: str,
+    topic: str | None = None,
+    force: bool = False,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[str]:
+    """Yield discovered repos, streaming search results as pages arrive.
+
+    The discovered set is cached for an hour. If a search fails midway, or
+    `deadline` passes or `cancel` is set before it finishes, the previously
+    cached repos are yielded so nothing drops out of the menu.
+    """
+    from tool_tray.logging import log_error, log_info
+
+    if not orgs:
+        return
+
+    cache = _load_cache()
+    key = _cache_key(orgs, topic)
+    if (
+        not force
+        and cache.get("key") == key
+        and time.time() - cache.get("discovered_at", 0) < _DISCOVERY_TTL_SECONDS
+    ):
+        yield from cache.get("repos", [])
+        return
+
+    found: list[str] = []
+    seen: set[str] = set()
+    try:
+        for org in orgs:
+            for repo in search_org_repos(org, token, topic, deadline, cancel):
+                if repo.lower() in seen:
+                    continue
+                seen.add(repo.lower())
+                found.append(repo)
+                yield repo
+    except httpx.HTTPError as e:
+        log_error("Repo discovery failed, using cached results", e)
+        previous = cache.get("repos", []) if cache.get("key") == key else []
+        for repo in previous:
+            if repo.lower() not in seen:
+                seen.add(repo.lower())
+                yield repo
+        return
+
+    _save_cache(orgs, topic, found)
+    log_info(f"Discovered {len(found)} repos in {', '.join(orgs)}")
+
+
+def iter_config_repos(
+    repos: list[str],
+    orgs: list[str],
+    token: str,
+    topic: str | None = None,
+    force: bool = False,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[str]:
+    """Yield configured repos followed by discovered ones, without duplicates."""
+    seen: set[str] = set()
+    discovered = iter_discovered_repos(orgs, token, topic, force, deadline, cancel)
+    for repo in chain(repos, discovered):
+        if repo.lower() not in seen:
+            seen.add(repo.lower())
+            yield repo
@@ -0,0 +1,70 @@
+import threading
+import time
+from collections.abc import Iterator
+
+import httpx
+
+API_URL = "https://api.github.com"
+REQUEST_TIMEOUT_SECONDS: float = 10
+
+
+def api_headers(token: str, accept: str = "application/vnd.github+json") -> dict:
+    """Build headers for a GitHub REST API request."""
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": accept,
+    }
+
+
+def expired(deadline: float | None, cancel: threading.Event | None) -> bool:
+    """True if a refresh ran out of time or was cancelled."""
+    if cancel is not None and cancel.is_set():
+        return True
+    return deadline is not None and time.time() >= deadline
+
+
+def request_timeout(deadline: float | None) -> float:
+    """HTTP timeout for one request, bounded by the remaining budget."""
+    if deadline is None:
+        return REQUEST_TIMEOUT_SECONDS
+    return max(1.0, min(REQUEST_TIMEOUT_SECONDS, deadline - time.time()))
+
+
+def iter_pages(
+    url: str,
+    token: str,
+    params: dict | None = None,
+    items_key: str | None = None,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[dict]:
+    """Yield items from a paginated GitHub list endpoint, one page at a time.
+
+    Pages are requested lazily, so callers that stop iterating early never
+    fetch the remaining pages. `items_key` selects the list inside the
+    response body for endpoints like search that wrap their results.
+
+    Each page request is bounded by `deadline` (epoch seconds), and no
+    further page is requested once it passes or `cancel` is set.
+
+    Raises:
+        httpx.HTTPError: If any page request fails, or the deadline passes
+            (or `cancel` is set) before the last page
+    """
+    next_url: str | None = url
+    next_params = params
+    while next_url:
+        if expired(deadline, cancel):
+            raise httpx.TimeoutException(f"Stopped listing {url}: out of time")
+        resp = httpx.get(
+            next_url,
+            headers=api_headers(token),
+            params=next_params,
+            timeout=request_timeout(deadline),
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        yield from data[items_key] if items_key else data
+        # The "next" link already carries the query string
+        next_url = resp.links.get("next", {}).get("url")
+        next_params = None
@@ -0,0 +1,144 @@
+import base64
+import io
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import httpx
+from PIL import Image, ImageOps
+
+from tool_tray.config import get_cache_dir, write_json
+from tool_tray.github import API_URL, api_headers
+from tool_tray.manifest import Manifest
+
+_BASE_SIZE: int = 256
+_ICO_SIZES: list[tuple[int, int]] = [(s, s) for s in (16, 24, 32, 48, 64, 128, 256)]
+
+_index_lock = threading.Lock()
+
+
+def get_icon_cache_dir() -> Path:
+    """Get the content-addressed icon cache directory."""
+    return get_cache_dir() / "icons"
+
+
+def _icon_filename() -> str:
+    """Icon format each platform's shortcuts expect."""
+    if sys.platform == "win32":
+        return "icon.ico"
+    elif sys.platform == "darwin":
+        return "icon.icns"
+    return "icon.png"
+
+
+def _load_index() -> dict:
+    path = get_icon_cache_dir() / "index.json"
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _save_index(index: dict) -> None:
+    from tool_tray.logging import log_error
+
+    path = get_icon_cache_dir() / "index.json"
+    try:
+        write_json(path, index)
+    except OSError as e:
+        log_error(f"Failed to save icon index: {path}", e)
+
+
+def get_cached_icon_shas() -> set[str]:
+    """Blob SHAs of the icons the cache index currently points to."""
+    with _index_lock:
+        return {entry["sha"] for entry in _load_index().values() if "sha" in entry}
+
+
+def _render_icons(data: bytes, target_dir: Path) -> None:
+    """Convert source image into square PNG/ICO/ICNS files in target_dir.
+
+    Raises:
+        OSError: If the image cannot be decoded or written
+    """
+    img = Image.open(io.BytesIO(data)).convert("RGBA")
+    # Fit into a transparent square so non-square sources aren't stretched
+    img = ImageOps.contain(img, (_BASE_SIZE, _BASE_SIZE), Image.Resampling.LANCZOS)
+    square = Image.new("RGBA", (_BASE_SIZE, _BASE_SIZE), (0, 0, 0, 0))
+    square.paste(img, ((_BASE_SIZE - img.width) // 2, (_BASE_SIZE - img.height) // 2))
+
+    tmp_dir = target_dir.with_name(target_dir.name + ".tmp")
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    square.save(tmp_dir / "icon.png")
+    if sys.platform == "win32":
+        square.save(tmp_dir / "icon.ico", sizes=_ICO_SIZES)
+    elif sys.platform == "darwin":
+        square.save(tmp_dir / "icon.icns")
+    os.replace(tmp_dir, target_dir)
+
+
+def fetch_tool_icon(repo: str, manifest: Manifest, token: str) -> str | None:
+    """Get a local, platform-ready copy of the manifest's icon.
+
+    Icons are stored by the blob SHA of the source file, so the same image is
+    converted once and reused across versions (and repos). The blob SHA is
+    revalidated with a conditional request, so unchanged icons cost one 304.
+    Returns None if the manifest has no icon or it cannot be fetched.
+    """
+    from tool_tray.logging import log_debug, log_error
+
+    if not manifest.icon:
+        return None
+
+    key = f"{repo}:{manifest.icon}"
+    with _index_lock:
+        entry = _load_index().get(key, {})
+
+    url = f"{API_URL}/repos/{repo}/contents/{manifest.icon.lstrip('/')}"
+    headers = api_headers(token, "application/vnd.github.object+json")
+    cached_dir = get_icon_cache_dir() / entry["sha"] if entry.get("sha") else None
+    if cached_dir and cached_dir.exists() and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
+    try:
+        resp = httpx.get(url, headers=headers, timeout=10)
+        if resp.status_code == 304 and cached_dir:
+            log_debug(f"Icon unchanged: {key}")
+            return str(cached_dir / _icon_filename())
+        resp.raise_for_status()
+        payload = resp.json()
+        sha = payload["sha"]
+        target_dir = get_icon_cache_dir() / sha
+
+        if not target_dir.exists():
+            if payload.get("content"):
+                data = base64.b64decode(payload["content"])
+            else:
+                # Files over 1 MB come without inline content
+                raw = httpx.get(
+                    url,
+                    headers=api_headers(token, "application/vnd.github.raw+json"),
+                    timeout=10,
+                )
+                raw.raise_for_status()
+                data = raw.content
+            _render_icons(data, target_dir)
+            log_debug(f"Icon cached: {key} -> {target_dir}")
+    except httpx.HTTPError as e:
+        log_error(f"Failed to fetch icon: {key}", e)
+        if cached_dir and cached_dir.exists():
+            return str(cached_dir / _icon_filename())
+        return None
+    except (OSError, KeyError, ValueError) as e:
+        log_error(f"Failed to convert icon: {key}", e)
+        return None
+
+    with _index_lock:
+        index = _load_index()
+        index[key] = {"sha": sha, "etag": resp.headers.get("etag")}
+        _save_index(index)
+    return str(target_dir / _icon_filename())
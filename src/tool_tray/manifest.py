@@ -1,8 +1,19 @@
+import base64
+import json
+import threading
+import time
 import tomllib
 from dataclasses import dataclass
+from pathlib import Path
 
 import httpx
 
+from tool_tray.config import get_cache_dir, write_json
+from tool_tray.singleflight import single_flight
+
+# How long to remember that a repo has no manifest (404)
+_MISSING_TTL_SECONDS: int = 3600
+
 
 @dataclass
 class Manifest:
@@ -15,6 +26,19 @@ class Manifest:
     desktop_icon: bool = False
     icon: str | None = None
     autostart: bool = False
+    category: str | None = None  # Menu group for large tool lists
+    sparse: list[str] | None = None  # git: only check out these paths
+    lfs: bool = True  # git: fetch Git LFS objects
+    warmup: str | None = None  # Command run after install to warm caches
+    version_source: str = "pyproject"  # pyproject | release | tag | commit
+    package: str | None = None  # Shared package name for [[tools]] entries
+    priority: str = "low"  # low | normal: priority of background installs
+    jobs: int | None = None  # Parallelism cap passed to build tools
+
+    @property
+    def install_name(self) -> str:
+        """Name of what gets installed (the package, for [[tools]] entries)."""
+        return self.package or self.name
 
     @classmethod
     def from_dict(cls, data: dict) -> "Manifest":
@@ -27,29 +51,251 @@ class Manifest:
             desktop_icon=data.get("desktop_icon", False),
             icon=data.get("icon"),
             autostart=data.get("autostart", False),
+            category=data.get("category"),
+            sparse=data.get("sparse"),
+            lfs=data.get("lfs", True),
+            warmup=data.get("warmup"),
+            version_source=data.get("version_source", "pyproject"),
+            package=data.get("package"),
+            priority=data.get("priority", "low"),
+            jobs=data.get("jobs"),
         )
 
+    def to_dict(self) -> dict:
+        """Serialize to a dict accepted by from_dict."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "launch": self.launch,
+            "build": self.build,
+            "desktop_icon": self.desktop_icon,
+            "icon": self.icon,
+            "autostart": self.autostart,
+            "category": self.category,
+            "sparse": self.sparse,
+            "lfs": self.lfs,
+            "warmup": self.warmup,
+            "version_source": self.version_source,
+            "package": self.package,
+            "priority": self.priority,
+            "jobs": self.jobs,
+        }
+
+
+def parse_manifests(data: dict) -> list[Manifest]:
+    """Create one Manifest per tool from parsed TOML.
+
+    A `[[tools]]` array describes several tools built from the same package
+    (e.g. a monorepo with several CLIs). Top-level keys are shared defaults;
+    each entry needs its own `name` and the top-level `name` is the package.
+
+    Raises:
+        KeyError: If a required field is missing
+    """
+    tools = data.get("tools")
+    if not tools:
+        return [Manifest.from_dict(data)]
+    shared = {key: value for key, value in data.items() if key != "tools"}
+    return [
+        Manifest.from_dict({**shared, **tool, "package": data["name"]})
+        for tool in tools
+    ]
+
+
+@dataclass
+class _CacheEntry:
+    """Cached manifest lookup for one repo."""
+
+    sha: str | None = None  # Blob SHA of tooltray.toml
+    etag: str | None = None
+    manifests: list[Manifest] | None = None
+    status: int | None = None  # HTTP status of a negative result
+    missing_until: float = 0  # Negative cache expiry (epoch seconds)
+
+
+_cache: dict[str, _CacheEntry] | None = None
+_cache_lock = threading.Lock()
+
 
-def fetch_manifest(repo: str, token: str) -> Manifest | None:
-    """Fetch tooltray.toml from GitHub repo."""
+def get_manifest_cache_path() -> Path:
+    """Get path to the persisted manifest cache."""
+    return get_cache_dir() / "manifests.json"
+
+
+def _load_cache() -> dict[str, _CacheEntry]:
+    """Load manifest cache from disk (caller holds _cache_lock)."""
+    global _cache
     from tool_tray.logging import log_debug, log_error
 
+    if _cache is not None:
+        return _cache
+
+    _cache = {}
+    path = get_manifest_cache_path()
+    if not path.exists():
+        return _cache
+
+    try:
+        data = json.loads(path.read_text())
+        for repo, record in data.get("repos", {}).items():
+            manifests = record.get("manifests")
+            _cache[repo] = _CacheEntry(
+                sha=record.get("sha"),
+                etag=record.get("etag"),
+                manifests=[Manifest.from_dict(m) for m in manifests]
+                if manifests
+                else None,
+                status=record.get("status"),
+                missing_until=record.get("missing_until", 0),
+            )
+        log_debug(f"Manifest cache loaded: {len(_cache)} repos")
+    except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+        log_error(f"Failed to load manifest cache: {path}", e)
+    return _cache
+
+
+def _save_cache(cache: dict[str, _CacheEntry]) -> None:
+    """Write manifest cache to disk (caller holds _cache_lock)."""
+    from tool_tray.logging import log_error
+
+    path = get_manifest_cache_path()
+    data = {
+        "version": 2,
+        "repos": {
+            repo: {
+                "sha": entry.sha,
+                "etag": entry.etag,
+                "manifests": [m.to_dict() for m in entry.manifests]
+                if entry.manifests
+                else None,
+                "status": entry.status,
+                "missing_until": entry.missing_until,
+            }
+            for repo, entry in cache.items()
+        },
+    }
+    try:
+        write_json(path, data)
+    except OSError as e:
+        log_error(f"Failed to save manifest cache: {path}", e)
+
+
+def _get_cache_entry(repo: str) -> _CacheEntry | None:
+    with _cache_lock:
+        return _load_cache().get(repo)
+
+
+def _set_cache_entry(repo: str, entry: _CacheEntry) -> None:
+    with _cache_lock:
+        cache = _load_cache()
+        cache[repo] = entry
+        _save_cache(cache)
+
+
+def clear_manifest_cache() -> None:
+    """Drop all cached manifests and negative results.
+
+    Recorded pushed_at values go too, or the next refresh would skip
+    repos that weren't pushed and never re-fetch their manifests.
+    """
+    global _cache
+    from tool_tray.logging import log_info
+    from tool_tray.repo_index import clear_pushed_at
+
+    with _cache_lock:
+        _cache = {}
+        get_manifest_cache_path().unlink(missing_ok=True)
+    clear_pushed_at()
+    log_info("Manifest cache cleared")
+
+
+def load_manifests(repo: str, token: str, timeout: float = 10) -> list[Manifest] | None:
+    """Fetch tooltray.toml from GitHub repo, raising on network/HTTP errors.
+
+    Returns one Manifest per tool the file describes (see parse_manifests).
+
+    Concurrent fetches for the same repo share one request.
+
+    Manifests are cached by blob SHA and revalidated with a conditional
+    request, so an unchanged manifest is neither re-downloaded nor re-parsed.
+    Returns None if the repo has no manifest (404); that is remembered for a
+    while before the repo is probed again. Denied access (401/403, including
+    rate limiting) is an error, never cached: callers keep the previous
+    status and the circuit breaker backs off.
+
+    Raises:
+        httpx.HTTPError: If the request fails for any other reason
+        tomllib.TOMLDecodeError: If the manifest is not valid TOML
+        KeyError: If a required field is missing
+    """
+    return single_flight(
+        f"manifest:{repo}", lambda: _load_manifests(repo, token, timeout)
+    )
+
+
+def _load_manifests(repo: str, token: str, timeout: float) -> list[Manifest] | None:
+    from tool_tray.logging import log_debug
+
+    entry = _get_cache_entry(repo)
+    now = time.time()
+    # Only 404s are cached (older caches may hold 401/403 results)
+    if entry and entry.status == 404 and entry.missing_until > now:
+        log_debug(f"Manifest negative-cached ({entry.status}): {repo}")
+        return None
+
     url = f"https://api.github.com/repos/{repo}/contents/tooltray.toml"
     headers = {
         "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github.raw+json",
+        "Accept": "application/vnd.github.object+json",
     }
+    if entry and entry.manifests and entry.etag:
+        headers["If-None-Match"] = entry.etag
+
     log_debug(f"Fetching manifest: {repo}")
+    resp = httpx.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and entry and entry.manifests:
+        log_debug(f"Manifest unchanged: {repo}")
+        return entry.manifests
+
+    if resp.status_code == 404:
+        log_debug(f"No manifest found: {repo}")
+        _set_cache_entry(
+            repo, _CacheEntry(status=404, missing_until=now + _MISSING_TTL_SECONDS)
+        )
+        return None
+    if resp.status_code in (401, 403):
+        limited = (
+            resp.headers.get("x-ratelimit-remaining") == "0"
+            or "retry-after" in resp.headers
+        )
+        reason = "rate limited" if limited else "access denied"
+        raise httpx.HTTPStatusError(
+            f"{reason} ({resp.status_code})", request=resp.request, response=resp
+        )
+
+    resp.raise_for_status()
+    payload = resp.json()
+    sha = payload["sha"]
+    if entry and entry.manifests and entry.sha == sha:
+        manifests = entry.manifests
+    else:
+        text = base64.b64decode(payload["content"]).decode()
+        manifests = parse_manifests(tomllib.loads(text))
+        names = ", ".join(f"{m.name} ({m.type})" for m in manifests)
+        log_debug(f"Manifest loaded: {repo} -> {names}")
+
+    _set_cache_entry(
+        repo, _CacheEntry(sha=sha, etag=resp.headers.get("etag"), manifests=manifests)
+    )
+    return manifests
+
+
+def fetch_manifests(repo: str, token: str) -> list[Manifest] | None:
+    """Fetch tooltray.toml from GitHub repo, logging and swallowing errors."""
+    from tool_tray.logging import log_error
+
     try:
-        resp = httpx.get(url, headers=headers, timeout=10)
-        if resp.status_code == 404:
-            log_debug(f"No manifest found: {repo}")
-            return None
-        resp.raise_for_status()
-        data = tomllib.loads(resp.text)
-        manifest = Manifest.from_dict(data)
-        log_debug(f"Manifest loaded: {repo} -> {manifest.name} ({manifest.type})")
-        return manifest
+        return load_manifests(repo, token)
     except httpx.HTTPError as e:
         log_error(f"HTTP error fetching manifest: {repo}", e)
         return None
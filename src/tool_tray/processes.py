@@ -0,0 +1,204 @@
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+_SAMPLE_SECONDS: float = 5.0
+_KILL_TIMEOUT_SECONDS: float = 3.0
+_STARTUP_SECONDS: float = 10.0  # Window in which startup CPU is measured
+
+
+@dataclass
+class TrackedProcess:
+    """A tool process launched by tooltray."""
+
+    name: str
+    executable: str
+    process: subprocess.Popen
+    started_at: float
+    cpu_percent: float = 0.0
+    rss_bytes: int = 0
+    stopped_by_user: bool = False
+    startup_cpu_seconds: float | None = None  # CPU used in the first seconds
+    _cpu_ticks: int = 0
+    _sampled_at: float = 0
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def running(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def hint(self) -> str:
+        """Compact menu hint like "running · 180 MB"."""
+        if not self.rss_bytes:
+            return "running"
+        mb = self.rss_bytes / (1024 * 1024)
+        text = f"running · {mb:.0f} MB"
+        if self.cpu_percent >= 1:
+            text += f" · {self.cpu_percent:.0f}% CPU"
+        return text
+
+
+_processes: dict[str, TrackedProcess] = {}
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_startup_listener: Callable[[str, float], None] | None = None
+
+
+def set_startup_listener(listener: Callable[[str, float], None] | None) -> None:
+    """Register a callback run with (name, cpu_seconds) once a launch settles."""
+    global _startup_listener
+    _startup_listener = listener
+
+
+def start_process(name: str, executable: str) -> TrackedProcess:
+    """Launch a tool and track it.
+
+    Raises:
+        OSError: If the executable cannot be started
+    """
+    global _thread
+    from tool_tray.logging import log_info
+
+    process = subprocess.Popen([executable])
+    tracked = TrackedProcess(
+        name=name, executable=executable, process=process, started_at=time.time()
+    )
+    with _lock:
+        _processes[name] = tracked
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=_sample_loop, daemon=True)
+            _thread.start()
+    log_info(f"Started: {name} (pid {process.pid})")
+    return tracked
+
+
+def get_process(name: str) -> TrackedProcess | None:
+    """Get the running process for a tool, if any."""
+    with _lock:
+        tracked = _processes.get(name)
+    if tracked and tracked.running:
+        return tracked
+    return None
+
+
+def kill_process(name: str) -> bool:
+    """Terminate a tool's process, killing it if it does not exit in time."""
+    from tool_tray.logging import log_info
+
+    tracked = get_process(name)
+    if not tracked:
+        return False
+
+    tracked.stopped_by_user = True
+    tracked.process.terminate()
+    try:
+        tracked.process.wait(timeout=_KILL_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        tracked.process.kill()
+        tracked.process.wait()
+    log_info(f"Stopped: {name} (pid {tracked.pid})")
+    return True
+
+
+def restart_process(name: str) -> TrackedProcess | None:
+    """Kill and relaunch a tool's process."""
+    from tool_tray.logging import log_error
+
+    with _lock:
+        tracked = _processes.get(name)
+    if not tracked:
+        return None
+
+    kill_process(name)
+    try:
+        return start_process(name, tracked.executable)
+    except OSError as e:
+        log_error(f"Failed to restart {name}", e)
+        return None
+
+
+def focus_process(name: str) -> bool:
+    """Best-effort: bring the tool's window to the front."""
+    from tool_tray.logging import log_debug
+
+    tracked = get_process(name)
+    if not tracked:
+        return False
+
+    pid = str(tracked.pid)
+    if sys.platform == "darwin":
+        script = (
+            'tell application "System Events" to set frontmost of '
+            f"(first process whose unix id is {pid}) to true"
+        )
+        cmd = ["osascript", "-e", script]
+    elif sys.platform == "win32":
+        log_debug("Focus not supported on Windows")
+        return False
+    elif shutil.which("xdotool"):
+        cmd = ["xdotool", "search", "--pid", pid, "windowactivate"]
+    else:
+        log_debug("Focus needs xdotool on Linux")
+        return False
+
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    return result.returncode == 0
+
+
+def _sample(tracked: TrackedProcess, now: float) -> None:
+    """Update CPU and RSS from /proc (Linux only)."""
+    proc = Path(f"/proc/{tracked.pid}")
+    try:
+        # Fields after the "(comm)" part; utime/stime are fields 14/15
+        stat = (proc / "stat").read_text().rsplit(")", 1)[1].split()
+        ticks = int(stat[11]) + int(stat[12])
+        rss_pages = int((proc / "statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return
+
+    if tracked._sampled_at:
+        elapsed = now - tracked._sampled_at
+        used = (ticks - tracked._cpu_ticks) / os.sysconf("SC_CLK_TCK")
+        tracked.cpu_percent = 100 * used / elapsed if elapsed > 0 else 0.0
+    tracked._cpu_ticks = ticks
+    tracked._sampled_at = now
+    tracked.rss_bytes = rss_pages * os.sysconf("SC_PAGE_SIZE")
+
+    if (
+        tracked.startup_cpu_seconds is None
+        and now - tracked.started_at >= _STARTUP_SECONDS
+    ):
+        tracked.startup_cpu_seconds = ticks / os.sysconf("SC_CLK_TCK")
+        if _startup_listener:
+            _startup_listener(tracked.name, tracked.startup_cpu_seconds)
+
+
+def _sample_loop() -> None:
+    """Sample all tracked processes at a low rate; exit when none remain."""
+    global _thread
+
+    while True:
+        now = time.time()
+        with _lock:
+            for name, tracked in list(_processes.items()):
+                if not tracked.running:
+                    del _processes[name]
+            tracked_now = list(_processes.values())
+            if not tracked_now:
+                _thread = None
+                return
+
+        if sys.platform.startswith("linux"):
+            for tracked in tracked_now:
+                _sample(tracked, now)
+        time.sleep(_SAMPLE_SECONDS)
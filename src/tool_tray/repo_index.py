@@ -0,0 +1,127 @@
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+
+from tool_tray.config import get_cache_dir, write_json
+from tool_tray.github import API_URL, expired, iter_pages
+
+
+def get_index_path() -> Path:
+    """Get path to the stored pushed_at values from the last refresh."""
+    return get_cache_dir() / "pushed_at.json"
+
+
+def load_pushed_at() -> dict[str, str]:
+    """Load repo -> pushed_at recorded by the last successful refresh."""
+    from tool_tray.logging import log_error
+
+    path = get_index_path()
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (json.JSONDecodeError, OSError) as e:
+        log_error(f"Failed to load repo index: {path}", e)
+        return {}
+
+
+def save_pushed_at(index: dict[str, str]) -> None:
+    """Persist repo -> pushed_at values."""
+    from tool_tray.logging import log_error
+
+    path = get_index_path()
+    try:
+        write_json(path, index)
+    except OSError as e:
+        log_error(f"Failed to save repo index: {path}", e)
+
+
+def clear_pushed_at() -> None:
+    """Forget recorded pushed_at values so the next refresh checks every repo."""
+    get_index_path().unlink(missing_ok=True)
+
+
+def iter_owner_repos(
+    owner: str,
+    token: str,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[dict]:
+    """Stream an org's (or user's) repos, most recently pushed first."""
+    params = {"per_page": 100, "sort": "pushed", "direction": "desc"}
+    try:
+        yield from iter_pages(
+            f"{API_URL}/orgs/{owner}/repos", token, params, None, deadline, cancel
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 404:
+            raise
+        # Not an org - fall back to the user listing
+        yield from iter_pages(
+            f"{API_URL}/users/{owner}/repos", token, params, None, deadline, cancel
+        )
+
+
+def list_pushed_at(
+    repos: list[str],
+    token: str,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> dict[str, str]:
+    """Get current pushed_at for repos with one listing per owner.
+
+    Listing stops as soon as every wanted repo of an owner has been seen,
+    and altogether once `deadline` passes or `cancel` is set. Repos that
+    are not found (or whose owner listing fails) are left out, so callers
+    treat them as changed.
+    """
+    from tool_tray.logging import log_debug, log_error
+
+    by_owner: dict[str, dict[str, str]] = {}
+    for repo in repos:
+        owner = repo.split("/")[0].lower()
+        by_owner.setdefault(owner, {})[repo.lower()] = repo
+
+    result: dict[str, str] = {}
+    for owner, wanted in by_owner.items():
+        if expired(deadline, cancel):
+            log_debug(f"Repo listing stopped before {owner}: out of time")
+            break
+        remaining = dict(wanted)
+        try:
+            for item in iter_owner_repos(owner, token, deadline, cancel):
+                repo = remaining.pop(item["full_name"].lower(), None)
+                if repo and item.get("pushed_at"):
+                    result[repo] = item["pushed_at"]
+                if not remaining:
+                    break
+        except httpx.HTTPError as e:
+            log_error(f"Failed to list repos for {owner}", e)
+        log_debug(f"Repo listing: {owner} ({len(wanted) - len(remaining)} found)")
+    return result
+
+
+def find_unchanged_repos(
+    repos: list[str],
+    token: str,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> tuple[set[str], dict[str, str]]:
+    """Find repos not pushed to since the last refresh.
+
+    Returns:
+        Tuple of (unchanged repos, current pushed_at values). Pass the
+        values for successfully refreshed repos to save_pushed_at afterwards.
+    """
+    from tool_tray.logging import log_info
+
+    previous = load_pushed_at()
+    current = list_pushed_at(repos, token, deadline, cancel)
+    unchanged = {
+        repo for repo, pushed_at in current.items() if previous.get(repo) == pushed_at
+    }
+    log_info(f"Changed repos: {len(repos) - len(unchanged)}/{len(repos)}")
+    return unchanged, current
@@ -0,0 +1,65 @@
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class _Call:
+    """An in-flight operation that duplicate callers wait on."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+    waiters: int = 0
+
+
+_calls: dict[str, _Call] = {}
+_lock = threading.Lock()
+
+
+def single_flight[T](key: str, fn: Callable[[], T]) -> T:
+    """Run fn, or wait for an identical in-flight call and share its result.
+
+    Concurrent callers with the same key are attached as waiters to the
+    first caller's run instead of executing fn again. Exceptions are shared
+    the same way. Once the run completes, the next call starts a new one.
+    """
+    from tool_tray.logging import log_debug
+
+    with _lock:
+        call = _calls.get(key)
+        leader = call is None
+        if call is None:
+            call = _Call()
+            _calls[key] = call
+        else:
+            call.waiters += 1
+
+    if not leader:
+        log_debug(f"Joining in-flight operation: {key}")
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fn()
+        return call.result
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _lock:
+            del _calls[key]
+        call.done.set()
+        if call.waiters:
+            log_debug(f"Shared result of {key} with {call.waiters} waiters")
+
+
+def wait_for(key: str) -> None:
+    """Block until the in-flight operation with this key (if any) finishes."""
+    with _lock:
+        call = _calls.get(key)
+    if call is not None:
+        call.done.wait()
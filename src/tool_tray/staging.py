@@ -0,0 +1,284 @@
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from tool_tray.config import get_cache_dir, write_json
+from tool_tray.github import API_URL, api_headers
+from tool_tray.manifest import Manifest
+from tool_tray.status import ToolStatus
+from tool_tray.updater import InstallPolicy
+
+_index_lock = threading.Lock()
+
+
+@dataclass
+class StagedUpdate:
+    """An update downloaded and built ahead of time, ready to switch to."""
+
+    repo: str
+    version: str
+    kind: str  # uv | git
+    path: str
+    commit: str | None
+    staged_at: str
+
+
+def get_staging_dir() -> Path:
+    """Get the staging directory for uv tool environments."""
+    return get_cache_dir() / "staging"
+
+
+def _git_staging_dir(repo: str) -> Path:
+    """Staged checkouts live next to the real ones so the switch is a rename."""
+    from tool_tray.updater import git_install_dir
+
+    install_dir = git_install_dir(repo)
+    return install_dir.parent / ".staging" / install_dir.name
+
+
+def _load_index() -> dict[str, StagedUpdate]:
+    path = get_staging_dir() / "index.json"
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+        return {repo: StagedUpdate(**entry) for repo, entry in data.items()}
+    except (json.JSONDecodeError, OSError, TypeError):
+        return {}
+
+
+def _save_index(index: dict[str, StagedUpdate]) -> None:
+    from tool_tray.logging import log_error
+
+    path = get_staging_dir() / "index.json"
+    try:
+        write_json(path, {r: asdict(s) for r, s in index.items()})
+    except OSError as e:
+        log_error(f"Failed to save staging index: {path}", e)
+
+
+def _discard(staged: StagedUpdate) -> None:
+    from tool_tray.logging import log_info
+
+    shutil.rmtree(staged.path, ignore_errors=True)
+    log_info(f"Discarded staged update: {staged.repo} {staged.version}")
+
+
+def get_staged_updates() -> dict[str, StagedUpdate]:
+    """Staged updates by repo."""
+    with _index_lock:
+        return _load_index()
+
+
+def is_staged(repo: str, manifest: Manifest, version: str) -> bool:
+    """Check whether apply_staged would switch to a staged `version`."""
+    staged = get_staged_updates().get(repo)
+    return (
+        staged is not None
+        and staged.version == version
+        and staged.kind == manifest.type
+        and Path(staged.path).exists()
+    )
+
+
+def discard_staged(repo: str) -> int:
+    """Drop a repo's staged update. Returns the bytes it used on disk."""
+    from tool_tray.versions import dir_size
+
+    with _index_lock:
+        index = _load_index()
+        staged = index.pop(repo, None)
+        if staged is None:
+            return 0
+        _save_index(index)
+    size = dir_size(Path(staged.path))
+    _discard(staged)
+    return size
+
+
+def get_head_commit(repo: str, token: str) -> str | None:
+    """Get the SHA of the default branch tip."""
+    try:
+        resp = httpx.get(
+            f"{API_URL}/repos/{repo}/commits/HEAD",
+            headers=api_headers(token, "application/vnd.github.sha"),
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.text.strip() or None
+    except httpx.HTTPError:
+        return None
+
+
+def stage_update(repo: str, manifest: Manifest, token: str, version: str) -> bool:
+    """Download and build `version` of a tool without touching the live install.
+
+    git tools are cloned and built into a staging checkout. uv environments
+    embed absolute paths and cannot be moved, so for uv tools the exact commit
+    is installed into a throwaway tool dir instead: this fills uv's cache with
+    the fetched source and built wheel, and applying is an offline reinstall.
+    A staged update for an older version of the same repo is discarded.
+    Staging always runs in the background, so it follows the manifest's
+    low-priority policy.
+    """
+    from tool_tray.logging import log_error, log_info
+    from tool_tray.updater import (
+        clone_git_tool,
+        install_policy,
+        install_url,
+        run_streamed,
+    )
+
+    with _index_lock:
+        current = _load_index().get(repo)
+    if current and current.version == version and current.kind == manifest.type:
+        return True
+    if current:
+        _discard(current)
+
+    commit = None
+    policy = install_policy(manifest, interactive=False)
+    try:
+        if manifest.type == "uv":
+            commit = get_head_commit(repo, token)
+            if not commit:
+                return False
+            path = get_staging_dir() / repo.replace("/", "__")
+            shutil.rmtree(path, ignore_errors=True)
+            env = dict(os.environ)
+            env["UV_TOOL_DIR"] = str(path / "tools")
+            env["UV_TOOL_BIN_DIR"] = str(path / "bin")
+            run_streamed(
+                [
+                    "uv",
+                    "tool",
+                    "install",
+                    f"{install_url(repo, token)}@{commit}",
+                ],
+                repo,
+                token,
+                env=env,
+                progress=False,
+                policy=policy,
+            )
+        elif manifest.type == "git":
+            path = _git_staging_dir(repo)
+            clone_git_tool(repo, manifest, token, path, progress=False, policy=policy)
+        else:
+            return False
+    except subprocess.CalledProcessError as e:
+        log_error(f"Failed to stage {repo}: {e.output or 'unknown error'}")
+        return False
+
+    staged = StagedUpdate(
+        repo=repo,
+        version=version,
+        kind=manifest.type,
+        path=str(path),
+        commit=commit,
+        staged_at=time.strftime("%Y-%m-%dT%H:%M:%S"),
+    )
+    with _index_lock:
+        index = _load_index()
+        index[repo] = staged
+        _save_index(index)
+    log_info(f"Staged update: {repo} {version}")
+    return True
+
+
+def apply_staged(
+    repo: str,
+    manifest: Manifest,
+    token: str,
+    version: str,
+    policy: InstallPolicy | None = None,
+) -> bool:
+    """Switch to a staged update. Returns False if none matches `version`.
+
+    On failure the staged update is dropped so a normal install can run.
+    """
+    from tool_tray.logging import log_error, log_info
+    from tool_tray.state import record_git_install
+    from tool_tray.updater import (
+        compile_bytecode,
+        git_install_dir,
+        install_url,
+        run_streamed,
+    )
+
+    with _index_lock:
+        index = _load_index()
+        staged = index.pop(repo, None)
+        if staged is None:
+            return False
+        _save_index(index)
+
+    if staged.version != version or staged.kind != manifest.type:
+        _discard(staged)
+        return False
+
+    start = time.time()
+    try:
+        if staged.kind == "uv":
+            # Everything is in uv's cache, so this only links files into place
+            run_streamed(
+                [
+                    "uv",
+                    "tool",
+                    "install",
+                    f"{install_url(repo, token)}@{staged.commit}",
+                    "--force",
+                    "--offline",
+                ],
+                repo,
+                token,
+                policy=policy,
+            )
+            shutil.rmtree(staged.path, ignore_errors=True)
+            # Compiling takes seconds for big environments; don't wait for it
+            threading.Thread(
+                target=compile_bytecode, args=(manifest,), daemon=True
+            ).start()
+        else:
+            install_dir = git_install_dir(repo)
+            old = install_dir.with_name(install_dir.name + ".old")
+            shutil.rmtree(old, ignore_errors=True)
+            if install_dir.exists():
+                os.replace(install_dir, old)
+            os.replace(staged.path, install_dir)
+            shutil.rmtree(old, ignore_errors=True)
+            sparse = manifest.sparse or []
+            strategy = "sparse" if sparse else "shallow"
+            record_git_install(repo, str(install_dir), strategy, sparse, manifest.lfs)
+    except (subprocess.CalledProcessError, OSError) as e:
+        log_error(f"Failed to apply staged update for {repo}", e)
+        _discard(staged)
+        return False
+
+    log_info(f"Applied staged update: {repo} {version} ({time.time() - start:.2f}s)")
+    return True
+
+
+def prestage_updates(statuses: tuple[ToolStatus, ...], token: str) -> None:
+    """Stage every available update and drop staged updates no longer wanted."""
+    wanted = {s.repo: s.remote for s in statuses if s.has_update and s.remote}
+
+    with _index_lock:
+        index = _load_index()
+        superseded = [s for s in index.values() if wanted.get(s.repo) != s.version]
+        for staged in superseded:
+            del index[staged.repo]
+        _save_index(index)
+    for staged in superseded:
+        _discard(staged)
+
+    for status in statuses:
+        if status.repo in wanted:
+            stage_update(status.repo, status.manifest, token, wanted[status.repo])
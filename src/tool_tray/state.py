@@ -1,9 +1,14 @@
 import json
-from dataclasses import dataclass, field
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
-from tool_tray.config import get_config_dir
+from tool_tray.config import get_config_dir, write_json
 
 
 @dataclass
@@ -14,6 +19,60 @@ class DesktopIconRecord:
     tool_name: str
     created_at: str
     repo: str
+    target: str = ""  # Executable the shortcut points to
+    icon: str | None = None
+
+
+@dataclass
+class GitInstallRecord:
+    """Record of how a git-type tool was cloned, reused for updates."""
+
+    path: str
+    strategy: str  # "shallow" | "sparse"
+    sparse: list[str]
+    lfs: bool
+    updated_at: str
+
+
+@dataclass
+class VersionRecord:
+    """A previous install kept aside for rollback."""
+
+    repo: str
+    tool_name: str
+    version: str
+    kind: str  # "uv" | "git"
+    path: str  # Where the old environment/checkout is kept
+    size: int  # Bytes on disk
+    retained_at: str
+    live_path: str = ""  # Where it was installed, and is restored to
+
+
+@dataclass
+class ToolTiming:
+    """Install and startup timings of a tool, to measure first-launch cost."""
+
+    installed_at: str
+    install_seconds: float
+    warmup_seconds: float | None = None
+    first_launch_cpu_seconds: float | None = None  # CPU used while starting
+
+
+@dataclass
+class UsageRecord:
+    """How often and how recently a tool was launched from tooltray."""
+
+    count: int
+    last_used: str
+
+
+@dataclass
+class InstalledTool:
+    """A package tooltray installed, so it can be garbage-collected later."""
+
+    name: str  # uv tool name or git checkout directory name
+    kind: str  # "uv" | "git"
+    installed_at: str
 
 
 @dataclass
@@ -22,6 +81,13 @@ class State:
 
     version: int = 1
     desktop_icons: dict[str, DesktopIconRecord] = field(default_factory=dict)
+    git_installs: dict[str, GitInstallRecord] = field(default_factory=dict)
+    recent_tools: list[str] = field(default_factory=list)  # Most recent first
+    versions: dict[str, list[VersionRecord]] = field(default_factory=dict)
+    timings: dict[str, ToolTiming] = field(default_factory=dict)
+    usage: dict[str, UsageRecord] = field(default_factory=dict)  # Keyed by repo
+    commits: dict[str, str] = field(default_factory=dict)  # Installed commit by repo
+    installed_tools: dict[str, InstalledTool] = field(default_factory=dict)
 
 
 def get_state_path() -> Path:
@@ -29,6 +95,65 @@ def get_state_path() -> Path:
     return get_config_dir() / "state.json"
 
 
+_lock = threading.RLock()
+_lock_depth: int = 0  # Nesting of _state_lock in the thread holding _lock
+
+
+@contextmanager
+def _lock_file(f: BinaryIO) -> Iterator[None]:
+    """Hold an exclusive lock on an open file (flock, or msvcrt on Windows)."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        yield  # Closing the file releases the flock
+
+
+@contextmanager
+def _state_lock() -> Iterator[None]:
+    """Serialise read-modify-write of state.json across threads and processes.
+
+    state.json is written by install, warm-up and sampler threads, and by
+    `tooltray gc` running as a separate process.
+    """
+    global _lock_depth
+
+    with _lock:
+        if _lock_depth:
+            _lock_depth += 1
+            try:
+                yield
+            finally:
+                _lock_depth -= 1
+            return
+
+        path = get_state_path().with_suffix(".lock")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f, _lock_file(f):
+            _lock_depth = 1
+            try:
+                yield
+            finally:
+                _lock_depth = 0
+
+
+@contextmanager
+def _edit_state() -> Iterator[State]:
+    """Load state for modification; it is saved when the block exits."""
+    with _state_lock():
+        state = load_state()
+        yield state
+        save_state(state)
+
+
 def load_state() -> State:
     """Load state from disk, returning empty state if not found."""
     from tool_tray.logging import log_debug, log_error
@@ -47,10 +172,43 @@ def load_state() -> State:
                 tool_name=record["tool_name"],
                 created_at=record["created_at"],
                 repo=record["repo"],
+                target=record.get("target", ""),
+                icon=record.get("icon"),
+            )
+        git_installs: dict[str, GitInstallRecord] = {}
+        for key, record in data.get("git_installs", {}).items():
+            git_installs[key] = GitInstallRecord(
+                path=record["path"],
+                strategy=record["strategy"],
+                sparse=record.get("sparse", []),
+                lfs=record.get("lfs", True),
+                updated_at=record["updated_at"],
             )
+        versions: dict[str, list[VersionRecord]] = {}
+        for key, records in data.get("versions", {}).items():
+            versions[key] = [VersionRecord(**record) for record in records]
+        timings = {
+            key: ToolTiming(**record) for key, record in data.get("timings", {}).items()
+        }
+        usage = {
+            key: UsageRecord(**record) for key, record in data.get("usage", {}).items()
+        }
         log_debug(f"State loaded: {len(icons)} desktop icons")
-        return State(version=data.get("version", 1), desktop_icons=icons)
-    except (json.JSONDecodeError, OSError, KeyError) as e:
+        return State(
+            version=data.get("version", 1),
+            desktop_icons=icons,
+            git_installs=git_installs,
+            recent_tools=data.get("recent_tools", []),
+            versions=versions,
+            timings=timings,
+            usage=usage,
+            commits=data.get("commits", {}),
+            installed_tools={
+                key: InstalledTool(**record)
+                for key, record in data.get("installed_tools", {}).items()
+            },
+        )
+    except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
         log_error(f"Failed to load state: {path}", e)
         return State()
 
@@ -60,8 +218,6 @@ def save_state(state: State) -> None:
     from tool_tray.logging import log_debug
 
     path = get_state_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-
     data = {
         "version": state.version,
         "desktop_icons": {
@@ -70,38 +226,191 @@ def save_state(state: State) -> None:
                 "tool_name": record.tool_name,
                 "created_at": record.created_at,
                 "repo": record.repo,
+                "target": record.target,
+                "icon": record.icon,
             }
             for key, record in state.desktop_icons.items()
         },
+        "git_installs": {
+            key: {
+                "path": record.path,
+                "strategy": record.strategy,
+                "sparse": record.sparse,
+                "lfs": record.lfs,
+                "updated_at": record.updated_at,
+            }
+            for key, record in state.git_installs.items()
+        },
+        "recent_tools": state.recent_tools,
+        "versions": {
+            key: [asdict(record) for record in records]
+            for key, records in state.versions.items()
+        },
+        "timings": {key: asdict(record) for key, record in state.timings.items()},
+        "usage": {key: asdict(record) for key, record in state.usage.items()},
+        "commits": state.commits,
+        "installed_tools": {
+            key: asdict(record) for key, record in state.installed_tools.items()
+        },
     }
-    path.write_text(json.dumps(data, indent=2))
+    with _state_lock():
+        write_json(path, data)
     log_debug(f"State saved: {len(state.desktop_icons)} desktop icons -> {path}")
 
 
-def record_desktop_icon(tool_name: str, path: str, repo: str) -> None:
+def record_desktop_icon(
+    tool_name: str,
+    path: str,
+    repo: str,
+    target: str = "",
+    icon: str | None = None,
+) -> None:
     """Record that we created a desktop icon."""
     from tool_tray.logging import log_debug
 
-    state = load_state()
-    state.desktop_icons[tool_name] = DesktopIconRecord(
-        path=path,
-        tool_name=tool_name,
-        created_at=datetime.now().isoformat(),
-        repo=repo,
-    )
-    save_state(state)
+    with _edit_state() as state:
+        state.desktop_icons[tool_name] = DesktopIconRecord(
+            path=path,
+            tool_name=tool_name,
+            created_at=datetime.now().isoformat(),
+            repo=repo,
+            target=target,
+            icon=icon,
+        )
     log_debug(f"Recorded desktop icon: {tool_name} -> {path}")
 
 
+def record_desktop_icons(records: list[DesktopIconRecord]) -> None:
+    """Record several created desktop icons with a single state write."""
+    from tool_tray.logging import log_debug
+
+    if not records:
+        return
+    with _edit_state() as state:
+        for record in records:
+            state.desktop_icons[record.tool_name] = record
+    log_debug(f"Recorded {len(records)} desktop icons")
+
+
 def remove_icon_record(tool_name: str) -> bool:
     """Remove a desktop icon record. Returns True if record existed."""
     from tool_tray.logging import log_debug
 
-    state = load_state()
-    if tool_name not in state.desktop_icons:
-        return False
+    with _state_lock():
+        state = load_state()
+        if tool_name not in state.desktop_icons:
+            return False
 
-    del state.desktop_icons[tool_name]
-    save_state(state)
+        del state.desktop_icons[tool_name]
+        save_state(state)
     log_debug(f"Removed icon record: {tool_name}")
     return True
+
+
+_MAX_RECENT_TOOLS: int = 5
+
+
+def record_launch(tool_name: str, repo: str) -> State:
+    """Count a launch and move the tool to the front of the recent list.
+
+    Returns the updated state.
+    """
+    with _edit_state() as state:
+        recent = [tool_name] + [t for t in state.recent_tools if t != tool_name]
+        state.recent_tools = recent[:_MAX_RECENT_TOOLS]
+        usage = state.usage.get(repo)
+        state.usage[repo] = UsageRecord(
+            count=(usage.count if usage else 0) + 1,
+            last_used=datetime.now().isoformat(),
+        )
+    return state
+
+
+def record_git_install(
+    repo: str, path: str, strategy: str, sparse: list[str], lfs: bool
+) -> None:
+    """Record the clone strategy used for a git-type tool."""
+    from tool_tray.logging import log_debug
+
+    with _edit_state() as state:
+        state.git_installs[repo] = GitInstallRecord(
+            path=path,
+            strategy=strategy,
+            sparse=sparse,
+            lfs=lfs,
+            updated_at=datetime.now().isoformat(),
+        )
+    log_debug(f"Recorded git install: {repo} ({strategy}) -> {path}")
+
+
+def record_version(record: VersionRecord) -> None:
+    """Record a retained version (newest first), replacing one at the same path."""
+    from tool_tray.logging import log_debug
+
+    with _edit_state() as state:
+        versions = state.versions.get(record.repo, [])
+        records = [r for r in versions if r.path != record.path]
+        state.versions[record.repo] = [record, *records]
+    log_debug(f"Recorded version: {record.repo} {record.version} -> {record.path}")
+
+
+def remove_version(record: VersionRecord) -> None:
+    """Forget a retained version."""
+    with _edit_state() as state:
+        versions = state.versions.get(record.repo, [])
+        records = [r for r in versions if r.path != record.path]
+        if records:
+            state.versions[record.repo] = records
+        else:
+            state.versions.pop(record.repo, None)
+
+
+def record_install_timing(tool_name: str, seconds: float) -> None:
+    """Record a finished install; startup timings are measured afresh."""
+    with _edit_state() as state:
+        state.timings[tool_name] = ToolTiming(
+            installed_at=datetime.now().isoformat(), install_seconds=round(seconds, 2)
+        )
+
+
+def record_warmup_timing(tool_name: str, seconds: float) -> None:
+    """Record how long a tool's warm-up command took."""
+    with _edit_state() as state:
+        timing = state.timings.get(tool_name)
+        if timing:
+            timing.warmup_seconds = round(seconds, 2)
+
+
+def record_first_launch(tool_name: str, cpu_seconds: float) -> None:
+    """Record startup CPU of the first launch after an install."""
+    from tool_tray.logging import log_info
+
+    with _state_lock():
+        state = load_state()
+        timing = state.timings.get(tool_name)
+        if timing is None or timing.first_launch_cpu_seconds is not None:
+            return
+        timing.first_launch_cpu_seconds = round(cpu_seconds, 2)
+        save_state(state)
+    log_info(f"First launch of {tool_name}: {cpu_seconds:.2f}s CPU at startup")
+
+
+def record_installed_commit(repo: str, commit: str) -> None:
+    """Record the commit installed for a tool tracked by commit."""
+    with _edit_state() as state:
+        state.commits[repo] = commit
+
+
+def record_installed_tool(repo: str, name: str, kind: str) -> None:
+    """Remember a package tooltray installed for a repo."""
+    with _edit_state() as state:
+        state.installed_tools[repo] = InstalledTool(
+            name=name, kind=kind, installed_at=datetime.now().isoformat()
+        )
+
+
+def remove_installed_tool(repo: str) -> None:
+    """Forget an installed package and its checkout (after it was removed)."""
+    with _edit_state() as state:
+        state.installed_tools.pop(repo, None)
+        state.git_installs.pop(repo, None)
@@ -0,0 +1,380 @@
+import json
+import threading
+import time
+import tomllib
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from tool_tray import breaker
+from tool_tray.config import get_cache_dir, write_json
+from tool_tray.github import expired, request_timeout
+from tool_tray.manifest import Manifest, load_manifests
+from tool_tray.updater import get_installed_version, get_tool_executable
+from tool_tray.version_sources import (
+    fetch_remote_version,
+    fetch_remote_versions,
+    is_newer,
+)
+
+_MAX_WORKERS: int = 8
+_POLL_SECONDS: float = 0.25  # How often a waiting refresh checks for cancel
+
+
+@dataclass(frozen=True)
+class ToolStatus:
+    repo: str
+    manifest: Manifest
+    installed: str | None
+    remote: str | None
+    executable: str | None = None
+    stale: bool = False  # Loaded from snapshot or kept after a failed fetch
+    # When GitHub was last asked; not part of equality so it never bumps
+    # the snapshot version on its own
+    checked_at: float = field(default=0, compare=False)
+
+    @property
+    def name(self) -> str:
+        return self.manifest.name
+
+    @property
+    def has_update(self) -> bool:
+        if not self.installed or not self.remote:
+            return False
+        return is_newer(self.remote, self.installed, self.manifest.version_source)
+
+    @property
+    def needs_update(self) -> bool:
+        """True if the tool is missing or outdated (what Update All installs)."""
+        return self.has_update or not self.installed
+
+    @property
+    def state(self) -> str:
+        """Short machine-readable state: not_installed | outdated | current."""
+        if not self.installed:
+            return "not_installed"
+        if self.has_update:
+            return "outdated"
+        return "current"
+
+    @property
+    def display_text(self) -> str:
+        if not self.installed:
+            return f"{self.name} (not installed)"
+        if self.has_update:
+            return f"{self.name} {self.installed} -> {self.remote}"
+        return f"{self.name} {self.installed}"
+
+    @property
+    def can_launch(self) -> bool:
+        return self.executable is not None and self.manifest.launch is not None
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """Immutable set of statuses published by one refresh.
+
+    Readers take a reference once and iterate it; refreshes build a new
+    snapshot and swap it in, so nobody ever sees a half-built list.
+    """
+
+    statuses: tuple[ToolStatus, ...] = ()
+    version: int = 0  # Bumped whenever the statuses change
+
+
+_snapshot = StatusSnapshot()
+_snapshot_lock = threading.Lock()
+
+
+def get_snapshot() -> StatusSnapshot:
+    """Get the current status snapshot (safe to hold across threads)."""
+    return _snapshot
+
+
+def publish_statuses(statuses: list[ToolStatus]) -> StatusSnapshot:
+    """Atomically replace the current snapshot if the statuses changed."""
+    global _snapshot
+
+    with _snapshot_lock:
+        if tuple(statuses) != _snapshot.statuses:
+            _snapshot = StatusSnapshot(tuple(statuses), _snapshot.version + 1)
+        return _snapshot
+
+
+def _stale(previous: Iterable[ToolStatus]) -> list[ToolStatus]:
+    return [replace(status, stale=True) for status in previous]
+
+
+def get_tool_statuses(
+    repo: str,
+    token: str,
+    previous: Iterable[ToolStatus] = (),
+    deadline: float | None = None,
+    prefetched: tuple[str, str | None] | None = None,
+    errors: dict[str, str] | None = None,
+) -> list[ToolStatus]:
+    """Compute statuses for one repo: one per tool in its tooltray.toml.
+
+    The manifest is fetched once and the remote version is looked up once
+    per version source, however many tools the repo defines. Returns an
+    empty list if the repo has no tooltray.toml.
+
+    `prefetched` is a (version source, remote version) pair from a batched
+    lookup; it is used if the manifest still names the same source.
+
+    If the manifest cannot be fetched (e.g. offline), the previous statuses
+    are returned marked as stale instead of dropping the tools from the menu.
+    Repos that keep failing are skipped by a circuit breaker for a while.
+    Why a repo could not be (fully) checked is recorded in `errors`.
+    """
+    from tool_tray.logging import log_debug, log_error
+
+    errors = {} if errors is None else errors
+    key = f"fetch:{repo}"
+    if not breaker.allow(key):
+        log_debug(f"Circuit open, skipping: {repo}")
+        errors[repo] = "skipped after repeated failures"
+        return _stale(previous)
+
+    with breaker.attempt(key) as attempt:
+        try:
+            manifests = load_manifests(repo, token, request_timeout(deadline))
+        except httpx.HTTPError as e:
+            # Only the first failure in a row gets a full stack trace
+            if attempt.fail() == 1:
+                log_error(f"HTTP error fetching manifest: {repo}", e)
+            else:
+                log_error(f"HTTP error fetching manifest: {repo}: {e}")
+            errors[repo] = f"manifest fetch failed: {e}"
+            return _stale(previous)
+        except (tomllib.TOMLDecodeError, KeyError, ValueError) as e:
+            if attempt.fail() == 1:
+                log_error(f"Invalid manifest: {repo}", e)
+            errors[repo] = f"invalid manifest: {e}"
+            return []
+
+    if not manifests:
+        return []  # Skip repos without tooltray.toml
+
+    remotes: dict[str, str | None] = {}
+    if prefetched:
+        remotes[prefetched[0]] = prefetched[1]
+
+    statuses: list[ToolStatus] = []
+    for manifest in manifests:
+        source = manifest.version_source
+        if source not in remotes:
+            remotes[source] = None
+            if token:
+                try:
+                    remotes[source] = fetch_remote_version(
+                        repo, token, source, request_timeout(deadline)
+                    )
+                except (httpx.HTTPError, ValueError) as e:
+                    log_error(f"Version lookup failed: {repo} ({source}): {e}")
+                    errors[repo] = f"version lookup failed: {e}"
+        remote = remotes[source]
+        installed = _installed_version(repo, manifest)
+        # Get launch command for executable lookup
+        launch_cmd = manifest.launch or manifest.name
+        executable = get_tool_executable(launch_cmd) if installed else None
+
+        log_debug(f"Status: {manifest.name} installed={installed} remote={remote}")
+        statuses.append(
+            ToolStatus(
+                repo=repo,
+                manifest=manifest,
+                installed=installed,
+                remote=remote,
+                executable=executable,
+                checked_at=time.time(),
+            )
+        )
+    return statuses
+
+
+def _installed_version(repo: str, manifest: Manifest) -> str | None:
+    """Installed version; for commit-tracked tools, the commit installed."""
+    from tool_tray.state import load_state
+
+    installed = get_installed_version(
+        manifest.package or manifest.launch or manifest.name
+    )
+    if installed and manifest.version_source == "commit":
+        return load_state().commits.get(repo, installed)
+    return installed
+
+
+def refresh_local_status(status: ToolStatus) -> ToolStatus:
+    """Re-check installed version and executable, keeping remote info."""
+    launch_cmd = status.manifest.launch or status.manifest.name
+    installed = _installed_version(status.repo, status.manifest)
+    executable = get_tool_executable(launch_cmd) if installed else None
+    return replace(status, installed=installed, executable=executable, stale=False)
+
+
+def fetch_statuses(
+    repos: Iterable[str],
+    token: str,
+    previous: Iterable[ToolStatus] | None = None,
+    unchanged: set[str] | None = None,
+    max_workers: int = _MAX_WORKERS,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+    errors: dict[str, str] | None = None,
+) -> list[ToolStatus]:
+    """Compute statuses for all repos in parallel, preserving repo order.
+
+    `repos` may be a lazy iterable (e.g. streamed discovery results); each
+    repo is submitted to the pool as soon as it arrives. Repos in `unchanged`
+    that have a previous status skip all GitHub requests and only have their
+    local install re-checked. Remote versions of the other previously known
+    repos are looked up up front in batches.
+
+    If `deadline` (epoch seconds) passes or `cancel` is set, pending work is
+    abandoned and the partial result is returned right away: repos that did
+    not finish keep their previous status, marked stale.
+
+    Repos that could not be checked are added to `errors` (repo -> reason).
+    """
+    from tool_tray.logging import log_error, log_info
+
+    errors = {} if errors is None else errors
+    previous_by_repo: dict[str, list[ToolStatus]] = {}
+    for status in previous or []:
+        previous_by_repo.setdefault(status.repo, []).append(status)
+    unchanged = unchanged or set()
+
+    # Known repos get their remote versions from one batched query
+    sources = {
+        repo: prev[0].manifest.version_source
+        for repo, prev in previous_by_repo.items()
+        if repo not in unchanged
+    }
+    prefetched: dict[str, tuple[str, str | None]] = {}
+    if token and sources and not expired(deadline, cancel):
+        batched = fetch_remote_versions(sources, token, deadline, cancel)
+        prefetched = {repo: (sources[repo], v) for repo, v in batched.items()}
+
+    def compute(repo: str) -> list[ToolStatus]:
+        prev = previous_by_repo.get(repo, [])
+        if expired(deadline, cancel):
+            return _stale(prev)
+        if prev and repo in unchanged:
+            return [refresh_local_status(status) for status in prev]
+        return get_tool_statuses(
+            repo, token, prev, deadline, prefetched.get(repo), errors
+        )
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    futures: list[tuple[str, Future]] = []
+    try:
+        for repo in repos:
+            futures.append((repo, pool.submit(compute, repo)))
+            if expired(deadline, cancel):
+                break  # Stop consuming (possibly streamed) repos
+        pending = {future for _, future in futures}
+        while pending and not expired(deadline, cancel):
+            timeout = _POLL_SECONDS
+            if deadline is not None:
+                timeout = max(0, min(timeout, deadline - time.time()))
+            _, pending = wait(pending, timeout=timeout)
+    finally:
+        # Don't block on in-flight requests; they finish in the background
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results: list[ToolStatus] = []
+    unfinished = 0
+    for repo, future in futures:
+        prev = previous_by_repo.get(repo, [])
+        if future.done() and not future.cancelled():
+            try:
+                results.extend(future.result())
+            except (httpx.HTTPError, OSError, ValueError, KeyError, TypeError) as e:
+                # e.g. uv missing, or an unexpected API response
+                log_error(f"Failed to refresh {repo}", e)
+                errors[repo] = f"refresh failed: {e}"
+                results.extend(_stale(prev))
+        else:
+            unfinished += 1
+            errors[repo] = "timed out"
+            results.extend(_stale(prev))
+
+    if expired(deadline, cancel):
+        # Repos never reached keep their previous status too
+        submitted = {repo for repo, _ in futures}
+        for repo, prev in previous_by_repo.items():
+            if repo not in submitted:
+                unfinished += 1
+                errors[repo] = "timed out"
+                results.extend(_stale(prev))
+        if unfinished:
+            log_info(f"Refresh stopped early: {unfinished} repos kept previous status")
+
+    return results
+
+
+def get_snapshot_path() -> Path:
+    """Get path to the persisted status snapshot."""
+    return get_cache_dir() / "statuses.json"
+
+
+def save_status_snapshot(statuses: Iterable[ToolStatus]) -> None:
+    """Persist statuses so the next startup can show them immediately."""
+    from tool_tray.logging import log_debug, log_error
+
+    path = get_snapshot_path()
+    data = {
+        "version": 1,
+        "saved_at": datetime.now().isoformat(),
+        "tools": [
+            {
+                "repo": s.repo,
+                "manifest": s.manifest.to_dict(),
+                "installed": s.installed,
+                "remote": s.remote,
+                "executable": s.executable,
+                "checked_at": s.checked_at,
+            }
+            for s in statuses
+        ],
+    }
+    try:
+        write_json(path, data)
+        log_debug(f"Status snapshot saved: {len(data['tools'])} tools -> {path}")
+    except OSError as e:
+        log_error(f"Failed to save status snapshot: {path}", e)
+
+
+def load_status_snapshot() -> list[ToolStatus]:
+    """Load the last persisted statuses, all marked as stale."""
+    from tool_tray.logging import log_debug, log_error
+
+    path = get_snapshot_path()
+    if not path.exists():
+        log_debug(f"Status snapshot not found: {path}")
+        return []
+
+    try:
+        data = json.loads(path.read_text())
+        statuses = [
+            ToolStatus(
+                repo=record["repo"],
+                manifest=Manifest.from_dict(record["manifest"]),
+                installed=record.get("installed"),
+                remote=record.get("remote"),
+                executable=record.get("executable"),
+                stale=True,
+                checked_at=record.get("checked_at", 0),
+            )
+            for record in data.get("tools", [])
+        ]
+        log_debug(f"Status snapshot loaded: {len(statuses)} tools")
+        return statuses
+    except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+        log_error(f"Failed to load status snapshot: {path}", e)
+        return []
@@ -0,0 +1,313 @@
+import shutil
+import subprocess
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from tool_tray.icons import get_cached_icon_shas, get_icon_cache_dir
+from tool_tray.staging import discard_staged, get_staged_updates
+from tool_tray.state import load_state, remove_installed_tool, remove_version
+from tool_tray.versions import dir_size, get_versions_dir
+
+_budget_bytes: int = 5 * 1024 * 1024 * 1024  # Disk for everything tooltray keeps
+
+# Eviction order: tools no longer in config, then rollback versions, then caches
+TIERS: tuple[str, ...] = ("tool", "version", "cache")
+
+
+@dataclass
+class Artefact:
+    """Something on disk that garbage collection may remove."""
+
+    kind: str  # tool | version | cache
+    description: str
+    path: str
+    size: int
+    last_used: float  # Unix time; least recently used is evicted first
+    remove: Callable[[], None]
+
+
+@dataclass
+class GcResult:
+    """Disk usage before collection and what was (or would be) evicted."""
+
+    total: int
+    live: int  # Bytes used by installed, configured tools (never evicted)
+    evicted: list[Artefact]
+
+    @property
+    def freed(self) -> int:
+        return sum(a.size for a in self.evicted)
+
+
+def set_disk_budget(budget_mb: int) -> None:
+    """Configure the disk budget for tool environments, clones and caches."""
+    global _budget_bytes
+    _budget_bytes = max(0, budget_mb) * 1024 * 1024
+
+
+def _timestamp(value: str | None, path: Path) -> float:
+    if value:
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0
+
+
+def _rmtree(path: Path) -> Callable[[], None]:
+    return lambda: shutil.rmtree(path, ignore_errors=True)
+
+
+def _discard_staged(repo: str) -> Callable[[], None]:
+    def remove() -> None:
+        discard_staged(repo)
+
+    return remove
+
+
+def _uninstall_uv_tool(repo: str, name: str) -> Callable[[], None]:
+    from tool_tray.updater import low_priority
+
+    def remove() -> None:
+        cmd, kwargs = low_priority(["uv", "tool", "uninstall", name])
+        subprocess.run(cmd, capture_output=True, check=False, **kwargs)
+        remove_installed_tool(repo)
+
+    return remove
+
+
+def _remove_checkout(repo: str, path: Path) -> Callable[[], None]:
+    def remove() -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        remove_installed_tool(repo)
+
+    return remove
+
+
+def collect_artefacts(
+    active_repos: Iterable[str] | None,
+) -> tuple[list[Artefact], int]:
+    """Find everything tooltray keeps on disk.
+
+    Returns (evictable artefacts, bytes used by live tools). Installs of
+    active repos are live and never evicted. If the active repos are not
+    known (None, e.g. org discovery hasn't run yet), all installs are live.
+
+    Installs from before tooltray recorded them are found too: checkouts
+    in its data directory, and uv tools it made desktop icons for.
+    """
+    from tool_tray.updater import git_install_dir, list_uv_tools
+
+    active = None if active_repos is None else {r.lower() for r in active_repos}
+    state = load_state()
+    artefacts: list[Artefact] = []
+    live = 0
+    seen: set[Path] = set()
+
+    def is_active(repo: str) -> bool:
+        return active is None or repo.lower() in active
+
+    def add_tool(
+        repo: str,
+        name: str,
+        kind: str,
+        path: Path,
+        installed_at: str | None,
+        keep: bool,
+    ) -> None:
+        nonlocal live
+        if path in seen or not path.exists():
+            return
+        seen.add(path)
+        size = dir_size(path)
+        if keep:
+            live += size
+            return
+        usage = state.usage.get(repo)
+        owner = f"{repo}, " if repo != name else ""
+        artefacts.append(
+            Artefact(
+                kind="tool",
+                description=f"{name} ({owner}no longer configured)",
+                path=str(path),
+                size=size,
+                last_used=_timestamp(usage.last_used if usage else installed_at, path),
+                remove=(
+                    _remove_checkout(repo, path)
+                    if kind == "git"
+                    else _uninstall_uv_tool(repo, name)
+                ),
+            )
+        )
+
+    uv_tools = [tool for tool in list_uv_tools() if tool.path]
+    uv_paths = {tool.name: tool.path for tool in uv_tools if tool.path}
+    for repo, tool in state.installed_tools.items():
+        if tool.kind == "git":
+            path = git_install_dir(repo)
+        elif tool.name in uv_paths:
+            path = Path(uv_paths[tool.name])
+        else:
+            continue
+        add_tool(repo, tool.name, tool.kind, path, tool.installed_at, is_active(repo))
+
+    # Unrecorded uv tools: only those tooltray made a desktop icon for are
+    # known to be its own
+    providers = {exe: tool for tool in uv_tools for exe in tool.executables}
+    for record in state.desktop_icons.values():
+        uv_tool = providers.get(record.tool_name)
+        if record.repo and uv_tool and uv_tool.path:
+            path = Path(uv_tool.path)
+            add_tool(
+                record.repo, uv_tool.name, "uv", path, None, is_active(record.repo)
+            )
+
+    # Unrecorded checkouts: every other directory in tooltray's data dir
+    share_dir = get_versions_dir().parent
+    owners = {Path(r.path).name: repo for repo, r in state.git_installs.items()}
+    active_dirs = {git_install_dir(r).name.lower() for r in active or ()}
+    for path in sorted(share_dir.iterdir()) if share_dir.exists() else ():
+        if (
+            not path.is_dir()
+            or path.name in ("versions", ".staging")
+            or path.name.endswith(".old")
+        ):
+            continue
+        # Unknown owner: the directory name stands in for the repo
+        repo = owners.get(path.name, path.name)
+        keep = is_active(repo) or path.name.lower() in active_dirs
+        add_tool(repo, path.name, "git", path, None, keep)
+
+    # Checkouts left behind by interrupted swaps
+    for path in share_dir.glob("*.old") if share_dir.exists() else ():
+        artefacts.append(
+            Artefact(
+                kind="cache",
+                description=f"{path.name} (leftover checkout)",
+                path=str(path),
+                size=dir_size(path),
+                last_used=_timestamp(None, path),
+                remove=_rmtree(path),
+            )
+        )
+
+    recorded = {Path(r.path) for records in state.versions.values() for r in records}
+    versions_dir = get_versions_dir()
+    for path in versions_dir.glob("*/*") if versions_dir.exists() else ():
+        if path.is_dir() and path not in recorded:
+            artefacts.append(
+                Artefact(
+                    kind="version",
+                    description=f"{path.parent.name} {path.name} (unrecorded rollback)",
+                    path=str(path),
+                    size=dir_size(path),
+                    last_used=_timestamp(None, path),
+                    remove=_rmtree(path),
+                )
+            )
+
+    for records in state.versions.values():
+        for record in records:
+            path = Path(record.path)
+            if not path.exists():
+                continue
+
+            def remove(record=record, path=path) -> None:
+                shutil.rmtree(path, ignore_errors=True)
+                remove_version(record)
+
+            artefacts.append(
+                Artefact(
+                    kind="version",
+                    description=f"{record.tool_name} {record.version} (rollback)",
+                    path=record.path,
+                    size=record.size,
+                    last_used=_timestamp(record.retained_at, path),
+                    remove=remove,
+                )
+            )
+
+    for repo, staged in get_staged_updates().items():
+        path = Path(staged.path)
+        if not path.exists():
+            continue
+        artefacts.append(
+            Artefact(
+                kind="cache",
+                description=f"{repo} {staged.version} (staged update)",
+                path=staged.path,
+                size=dir_size(path),
+                last_used=_timestamp(staged.staged_at, path),
+                remove=_discard_staged(repo),
+            )
+        )
+
+    icon_dir = get_icon_cache_dir()
+    referenced = get_cached_icon_shas()
+    referenced |= {
+        Path(r.icon).parent.name for r in state.desktop_icons.values() if r.icon
+    }
+    for path in icon_dir.iterdir() if icon_dir.exists() else ():
+        if path.is_dir() and path.name not in referenced:
+            artefacts.append(
+                Artefact(
+                    kind="cache",
+                    description=f"icon {path.name[:7]} (unused)",
+                    path=str(path),
+                    size=dir_size(path),
+                    last_used=_timestamp(None, path),
+                    remove=_rmtree(path),
+                )
+            )
+
+    return artefacts, live
+
+
+def plan_eviction(artefacts: list[Artefact], live: int, budget: int) -> list[Artefact]:
+    """Pick artefacts to evict until usage fits the budget.
+
+    Tiers are evicted in order (see TIERS), least recently used first.
+    """
+    total = live + sum(a.size for a in artefacts)
+    evict: list[Artefact] = []
+    ordered = sorted(artefacts, key=lambda a: (TIERS.index(a.kind), a.last_used))
+    for artefact in ordered:
+        if total <= budget:
+            break
+        evict.append(artefact)
+        total -= artefact.size
+    return evict
+
+
+def collect_garbage(
+    active_repos: Iterable[str] | None, dry_run: bool = False
+) -> GcResult:
+    """Evict least recently used artefacts until disk usage fits the budget.
+
+    Pass None as `active_repos` when the configured repos aren't known;
+    installed tools are then never removed.
+    """
+    from tool_tray.logging import log_error, log_info
+
+    artefacts, live = collect_artefacts(active_repos)
+    evict = plan_eviction(artefacts, live, _budget_bytes)
+    result = GcResult(
+        total=live + sum(a.size for a in artefacts), live=live, evicted=evict
+    )
+    if dry_run:
+        return result
+    for artefact in evict:
+        try:
+            artefact.remove()
+        except OSError as e:
+            log_error(f"GC failed to remove {artefact.path}", e)
+    if evict:
+        log_info(
+            f"GC evicted {len(evict)} artefacts ({result.freed // (1024 * 1024)} MB)"
+        )
+    return result
@@ -0,0 +1,177 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from tool_tray.processes import TrackedProcess, get_process, start_process
+from tool_tray.status import ToolStatus
+
+_INITIAL_DELAY_SECONDS: int = 10  # Let the tray's own startup refresh go first
+_STAGGER_SECONDS: int = 5  # Gap between autostart launches at login
+_POLL_SECONDS: float = 1.0
+_BACKOFF_BASE_SECONDS: int = 2
+_BACKOFF_MAX_SECONDS: int = 300
+_STABLE_SECONDS: int = 60  # Uptime after which the crash counter resets
+_MAX_CRASHES: int = 5  # Consecutive quick crashes before giving up
+
+
+@dataclass
+class SupervisedTool:
+    """An autostart tool kept running by the supervisor."""
+
+    name: str
+    executable: str
+    state: str = "pending"  # pending | running | crashed | exited | stopped | failed
+    crashes: int = 0
+    next_start: float = 0
+    started_at: float = 0
+    process: TrackedProcess | None = None
+
+    @property
+    def state_text(self) -> str:
+        """Short state for menu display."""
+        if self.state == "crashed":
+            wait = max(0, int(self.next_start - time.time()))
+            return f"crashed, restart in {wait}s"
+        if self.state == "pending":
+            return "starting"
+        return self.state
+
+
+_tools: dict[str, SupervisedTool] = {}
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_stop = threading.Event()
+
+
+def supervise(statuses: tuple[ToolStatus, ...]) -> None:
+    """Start supervising launchable autostart tools not yet supervised.
+
+    New tools are scheduled on a staggered timeline so logins do not start
+    every background tool at once. Tools no longer marked autostart (or no
+    longer installed) stop being supervised but are left running.
+    """
+    global _thread
+    from tool_tray.logging import log_info
+
+    wanted = {
+        s.name: s.executable
+        for s in statuses
+        if s.manifest.autostart and s.executable is not None
+    }
+
+    with _lock:
+        for name in list(_tools):
+            if name not in wanted:
+                log_info(f"Autostart: no longer supervising {name}")
+                del _tools[name]
+
+        # Continue the stagger after the last scheduled start
+        now = time.time()
+        slot = max(
+            [now + _INITIAL_DELAY_SECONDS - _STAGGER_SECONDS]
+            + [t.next_start for t in _tools.values() if t.state == "pending"]
+        )
+        for name, executable in wanted.items():
+            if name in _tools or executable is None:
+                continue
+            slot += _STAGGER_SECONDS
+            _tools[name] = SupervisedTool(
+                name=name, executable=executable, next_start=slot
+            )
+            log_info(f"Autostart: {name} scheduled in {int(slot - now)}s")
+
+    if _tools and (_thread is None or not _thread.is_alive()):
+        _stop.clear()
+        _thread = threading.Thread(target=_run, daemon=True)
+        _thread.start()
+
+
+def get_supervised(name: str) -> SupervisedTool | None:
+    """Get supervision info for a tool, if it is an autostart tool."""
+    with _lock:
+        return _tools.get(name)
+
+
+def stop_supervisor() -> None:
+    """Stop restarting tools. Running tools are left alone."""
+    _stop.set()
+
+
+def _start(tool: SupervisedTool) -> None:
+    from tool_tray.logging import log_error, log_info
+
+    running = get_process(tool.name)
+    if running:
+        # Already running (e.g. launched from the menu) - adopt it
+        log_info(f"Autostart: {tool.name} already running")
+        tool.process = running
+        tool.state = "running"
+        tool.started_at = time.time()
+        return
+
+    try:
+        tool.process = start_process(tool.name, tool.executable)
+        tool.state = "running"
+        tool.started_at = time.time()
+        log_info(f"Autostart: started {tool.name} (pid {tool.process.pid})")
+    except OSError as e:
+        log_error(f"Autostart: failed to start {tool.name}", e)
+        _schedule_restart(tool)
+
+
+def _schedule_restart(tool: SupervisedTool) -> None:
+    from tool_tray.logging import log_error
+
+    tool.process = None
+    tool.crashes += 1
+    if tool.crashes >= _MAX_CRASHES:
+        tool.state = "failed"
+        log_error(f"Autostart: {tool.name} crashed {tool.crashes} times, giving up")
+        return
+
+    delay = min(_BACKOFF_BASE_SECONDS * 2 ** (tool.crashes - 1), _BACKOFF_MAX_SECONDS)
+    tool.state = "crashed"
+    tool.next_start = time.time() + delay
+    log_error(f"Autostart: {tool.name} crashed, restarting in {delay}s")
+
+
+def _check(tool: SupervisedTool, now: float) -> None:
+    from tool_tray.logging import log_info
+
+    if tool.state in ("pending", "crashed") and now >= tool.next_start:
+        _start(tool)
+        return
+
+    if tool.state != "running" or tool.process is None:
+        return
+
+    current = get_process(tool.name)
+    if current and current is not tool.process:
+        # Restarted from the menu - follow the new process
+        tool.process = current
+        tool.started_at = current.started_at
+        return
+
+    code = tool.process.process.poll()
+    if code is None:
+        if tool.crashes and now - tool.started_at > _STABLE_SECONDS:
+            tool.crashes = 0
+        return
+
+    if code == 0 or tool.process.stopped_by_user:
+        # Clean exit or killed from the menu - don't restart
+        tool.state = "stopped" if tool.process.stopped_by_user else "exited"
+        tool.process = None
+        log_info(f"Autostart: {tool.name} {tool.state}")
+    else:
+        if now - tool.started_at > _STABLE_SECONDS:
+            tool.crashes = 0
+        _schedule_restart(tool)
+
+
+def _run() -> None:
+    while not _stop.wait(_POLL_SECONDS):
+        now = time.time()
+        with _lock:
+            for tool in list(_tools.values()):
+                _check(tool, now)
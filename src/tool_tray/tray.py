@@ -7,9 +7,43 @@ from typing import Any
 import pystray
 from PIL import Image, ImageDraw
 
-from tool_tray.config import config_exists, load_config
-from tool_tray.manifest import Manifest, fetch_manifest
-from tool_tray.updater import get_installed_version, get_remote_version, install_tool
+from tool_tray import breaker
+from tool_tray.config import config_exists, get_config_path, load_config
+from tool_tray.discovery import iter_config_repos, load_discovered_repos
+from tool_tray.manifest import Manifest
+from tool_tray.processes import (
+    focus_process,
+    get_process,
+    kill_process,
+    restart_process,
+    set_startup_listener,
+    start_process,
+)
+from tool_tray.repo_index import (
+    clear_pushed_at,
+    find_unchanged_repos,
+    load_pushed_at,
+    save_pushed_at,
+)
+from tool_tray.singleflight import single_flight, wait_for
+from tool_tray.state import UsageRecord, VersionRecord
+from tool_tray.status import (
+    ToolStatus,
+    fetch_statuses,
+    get_snapshot,
+    load_status_snapshot,
+    publish_statuses,
+    save_status_snapshot,
+)
+from tool_tray.supervisor import get_supervised, stop_supervisor, supervise
+from tool_tray.updater import (
+    get_install_progress,
+    install_tool,
+    low_priority,
+    set_progress_listener,
+)
+from tool_tray.usage import dormant_repos, order_by_usage, sort_statuses
+from tool_tray.versions import rollback, set_retention
 
 
 @dataclass
@@ -21,43 +55,27 @@ class OrphanedIcon:
     reason: str  # "tool_removed", "desktop_icon_disabled", "file_missing"
 
 
-@dataclass
-class ToolStatus:
-    repo: str
-    manifest: Manifest
-    installed: str | None
-    remote: str | None
-    executable: str | None = None
-
-    @property
-    def name(self) -> str:
-        return self.manifest.name
-
-    @property
-    def has_update(self) -> bool:
-        if not self.installed or not self.remote:
-            return False
-        return self.installed != self.remote
-
-    @property
-    def display_text(self) -> str:
-        if not self.installed:
-            return f"{self.name} (not installed)"
-        if self.has_update:
-            return f"{self.name} {self.installed} -> {self.remote}"
-        return f"{self.name} {self.installed}"
-
-    @property
-    def can_launch(self) -> bool:
-        return self.executable is not None and self.manifest.launch is not None
-
-
 _token: str = ""
 _repos: list[str] = []
-_tool_statuses: list[ToolStatus] = []
+_orgs: list[str] = []
+_topic: str | None = None
 _icon: Any = None
 _last_refresh: float = 0
 _REFRESH_THROTTLE_SECONDS: int = 30
+_GROUP_THRESHOLD: int = 15  # Group into submenus above this many tools
+_menu_group: str = "auto"  # auto | none | org | category | status
+_prestage: bool = False  # Download and build updates before Update All
+_recent_tools: list[str] = []
+_usage: dict[str, UsageRecord] = {}  # Launch counts by repo
+_menu_sort: str = "config"  # config | usage
+_REFRESH_DEADLINE_SECONDS: int = 20  # Publish partial results after this
+_refresh_cancel = threading.Event()  # Cancels the current refresh
+
+# Menu model: items are only rebuilt when the data they show changes
+_orphans: list[OrphanedIcon] = []
+_rollbacks: list[VersionRecord] = []  # Kept versions offered for rollback
+_config_mtime: float | None = None
+_menu_cache: tuple[tuple, list[Any]] | None = None
 
 
 def create_icon() -> Image.Image:
@@ -70,62 +88,91 @@ def create_icon() -> Image.Image:
     return img
 
 
-def get_tool_executable(tool_name: str) -> str | None:
-    """Get executable path from uv tool list --show-paths."""
-    try:
-        result = subprocess.run(
-            ["uv", "tool", "list", "--show-paths"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        for line in result.stdout.splitlines():
-            if line.startswith(f"- {tool_name} "):
-                start = line.find("(")
-                end = line.find(")")
-                if start != -1 and end != -1:
-                    return line[start + 1 : end]
-        return None
-    except subprocess.CalledProcessError:
-        return None
-
-
 def launch_tool(tool_name: str) -> None:
     """Launch a tool by name."""
     from tool_tray.logging import log_error, log_info
+    from tool_tray.state import record_launch
+
+    global _recent_tools, _usage
+
+    if get_process(tool_name):
+        # Don't start a second copy - bring the running one forward instead
+        log_info(f"Already running, focusing: {tool_name}")
+        focus_process(tool_name)
+        return
 
-    for status in _tool_statuses:
+    for status in get_snapshot().statuses:
         if status.name == tool_name and status.executable:
             log_info(f"Launching: {tool_name} -> {status.executable}")
             try:
-                subprocess.Popen([status.executable])
+                start_process(tool_name, status.executable)
             except OSError as e:
                 log_error(f"Failed to launch {tool_name}", e)
+                break
+            state = record_launch(tool_name, status.repo)
+            _recent_tools = state.recent_tools
+            _usage = state.usage
             break
 
 
 def reload_config() -> bool:
     """Reload config from disk. Returns True if config exists."""
-    global _token, _repos
+    global _token, _repos, _orgs, _topic, _menu_group, _menu_sort, _prestage
 
     config = load_config()
     if not config:
         _token = ""
         _repos = []
+        _orgs = []
+        _topic = None
         return False
 
     _token = config.get("token", "")
     _repos = config.get("repos", [])
+    _orgs = config.get("orgs", [])
+    _topic = config.get("topic")
+    _menu_group = config.get("menu_group", "auto")
+    _menu_sort = config.get("menu_sort", "config")
+    _prestage = bool(config.get("prestage", False))
+    set_retention(
+        config.get("keep_versions", 2), config.get("rollback_budget_mb", 1024)
+    )
     return True
 
 
-def refresh_statuses(force: bool = False) -> None:
-    """Refresh version info for all repos with manifests."""
+def reload_config_if_changed() -> bool:
+    """Reload config only if the file changed since it was last read."""
+    global _config_mtime
+
+    path = get_config_path()
+    mtime = path.stat().st_mtime if path.exists() else None
+    if mtime == _config_mtime:
+        return False
+    _config_mtime = mtime
+    reload_config()
+    return True
+
+
+def known_repos() -> list[str]:
+    """Configured repos plus the last discovered org repos."""
+    discovered = load_discovered_repos(_orgs, _topic)
+    return list(dict.fromkeys(_repos + discovered))
+
+
+def refresh_statuses(
+    force: bool = False, cancel: threading.Event | None = None
+) -> None:
+    """Refresh version info for all repos with manifests.
+
+    The refresh has a fixed time budget; when it runs out, whatever finished
+    is published and the rest keep their previous status. If `cancel` is set
+    (quit, or superseded by a newer refresh) nothing is published.
+    """
     import time
 
     from tool_tray.logging import log_debug, log_info
 
-    global _tool_statuses, _last_refresh
+    global _last_refresh
 
     # Throttle refreshes to avoid hitting GitHub API repeatedly
     now = time.time()
@@ -137,37 +184,142 @@ def refresh_statuses(force: bool = False) -> None:
         log_debug(f"Refresh throttled ({int(now - _last_refresh)}s since last)")
         return
 
-    _tool_statuses = []
     _last_refresh = now
+    deadline = now + _REFRESH_DEADLINE_SECONDS
+
+    repos = known_repos()
+    previous = get_snapshot().statuses
+    log_info(f"Refreshing {len(repos)} repos ({len(_orgs)} orgs)")
+    unchanged, pushed_at = find_unchanged_repos(repos, _token, deadline, cancel)
+    # Long-unused tools are only re-checked about once a day
+    dormant = set() if force else dormant_repos(previous, _usage)
+    errors: dict[str, str] = {}
+    # Most used tools go first so they make the deadline; discovery results
+    # (if expired) stream into the fetch pool after them as they arrive
+    statuses = fetch_statuses(
+        iter_config_repos(
+            order_by_usage(repos, _usage),
+            _orgs,
+            _token,
+            _topic,
+            deadline=deadline,
+            cancel=cancel,
+        ),
+        _token,
+        previous=previous,
+        unchanged=unchanged | dormant,
+        deadline=deadline,
+        cancel=cancel,
+        errors=errors,
+    )
+    if cancel is not None and cancel.is_set():
+        log_info("Refresh cancelled")
+        return
+    # Keep the menu in config order regardless of fetch order
+    rank = {repo: i for i, repo in enumerate(repos)}
+    statuses.sort(key=lambda s: rank.get(s.repo, len(rank)))
+
+    save_status_snapshot(statuses)
+    snapshot = publish_statuses(statuses)
+
+    # Only remember pushed_at for repos that were refreshed successfully;
+    # a failed version lookup leaves a fresh status with no remote version
+    skipped = {s.repo for s in snapshot.statuses if s.stale} | dormant | set(errors)
+    save_pushed_at(
+        load_pushed_at()
+        | {repo: value for repo, value in pushed_at.items() if repo not in skipped}
+    )
 
-    log_info(f"Refreshing {len(_repos)} repos")
-    for repo in _repos:
-        manifest = fetch_manifest(repo, _token)
-        if not manifest:
-            continue  # Skip repos without tooltray.toml
-
-        # Get launch command for executable lookup
-        launch_cmd = manifest.launch or manifest.name
-        installed = get_installed_version(launch_cmd)
-        remote = get_remote_version(repo, _token) if _token else None
-        executable = get_tool_executable(launch_cmd) if installed else None
-
-        _tool_statuses.append(
-            ToolStatus(
-                repo=repo,
-                manifest=manifest,
-                installed=installed,
-                remote=remote,
-                executable=executable,
-            )
-        )
-        log_debug(f"Status: {manifest.name} installed={installed} remote={remote}")
+    log_info(f"Refresh complete: {len(snapshot.statuses)} tools loaded")
+    supervise(snapshot.statuses)
+    refresh_orphans()
+    notify_menu_changed()
+
+    if _prestage:
+        from tool_tray.staging import prestage_updates
+
+        threading.Thread(
+            target=lambda: single_flight(
+                "prestage",
+                lambda: prestage_updates(
+                    tuple(sort_statuses(snapshot.statuses, _usage)), _token
+                ),
+            ),
+            daemon=True,
+        ).start()
 
-    log_info(f"Refresh complete: {len(_tool_statuses)} tools loaded")
+
+def refresh_orphans() -> None:
+    """Recompute orphaned icons shown in the menu."""
+    global _orphans
+
+    _orphans = find_orphaned_icons()
+
+
+def refresh_rollbacks() -> None:
+    """Reload the kept versions shown in the Roll Back submenu."""
+    from tool_tray.state import load_state
+
+    global _rollbacks
+
+    _rollbacks = [r for records in load_state().versions.values() for r in records]
+
+
+def notify_menu_changed() -> None:
+    """Ask pystray to re-read the menu, but only if its content changed."""
+    if _icon is None:
+        return
+    if _menu_cache is None or _menu_cache[0] != menu_key():
+        _icon.update_menu()
+
+
+def on_install_progress() -> None:
+    """Show running installs in the tray title and menu."""
+    if _icon is None:
+        return
+    progress = get_install_progress()
+    if progress:
+        repo, text = next(iter(progress.items()))
+        title = f"Tool Tray - installing {repo.split('/')[-1]}: {text}"
+        if len(progress) > 1:
+            title += f" (+{len(progress) - 1} more)"
+        _icon.title = title
+    else:
+        _icon.title = "Tool Tray"
+    notify_menu_changed()
+
+
+def refresh_in_background(force: bool = False) -> None:
+    """Revalidate statuses in a background thread.
+
+    Concurrent refresh requests share one in-flight refresh. A forced refresh
+    supersedes (cancels) the running one and starts as soon as it stops.
+    """
+    if force:
+        _refresh_cancel.set()
+
+    def run() -> None:
+        global _refresh_cancel
+
+        cancel = threading.Event()
+        _refresh_cancel = cancel
+        refresh_statuses(force, cancel)
+
+    def worker() -> None:
+        if force:
+            wait_for("refresh")
+        single_flight("refresh", run)
+
+    threading.Thread(target=worker, daemon=True).start()
+
+
+def cancel_refresh() -> None:
+    """Cancel the running refresh, if any."""
+    _refresh_cancel.set()
 
 
 def find_orphaned_icons() -> list[OrphanedIcon]:
-    """Find desktop icons that should be cleaned up. Called each time menu opens."""
+    """Find desktop icons that should be cleaned up. Called after refreshes."""
     from tool_tray.state import load_state
 
     orphans: list[OrphanedIcon] = []
@@ -176,11 +328,11 @@ def find_orphaned_icons() -> list[OrphanedIcon]:
     if not state.desktop_icons:
         return orphans
 
-    # Build set of active repos and their manifests
-    active_repos = set(_repos)
-    manifest_by_repo: dict[str, Manifest] = {}
-    for status in _tool_statuses:
-        manifest_by_repo[status.repo] = status.manifest
+    # Build set of active repos and their tools' manifests
+    active_repos = set(known_repos())
+    manifest_by_tool: dict[str, Manifest] = {}
+    for status in get_snapshot().statuses:
+        manifest_by_tool[status.manifest.launch or status.name] = status.manifest
 
     for tool_name, record in state.desktop_icons.items():
         icon_path = Path(record.path)
@@ -208,7 +360,7 @@ def find_orphaned_icons() -> list[OrphanedIcon]:
             continue
 
         # Check if desktop_icon was disabled in manifest
-        manifest = manifest_by_repo.get(record.repo)
+        manifest = manifest_by_tool.get(tool_name)
         if manifest and not manifest.desktop_icon:
             orphans.append(
                 OrphanedIcon(
@@ -248,16 +400,49 @@ def cleanup_orphans(orphans: list[OrphanedIcon]) -> int:
 
 def update_all() -> None:
     """Install/update all tools with available updates."""
+    from tool_tray.desktop import create_desktop_icons
+
     if not _token:
         return
-    for status in _tool_statuses:
-        if status.has_update or not status.installed:
-            install_tool(status.repo, status.manifest, _token)
+    # Work from one snapshot so a concurrent refresh can't skip tools
+    icon_batch: list[tuple[str, Manifest]] = []
+    installed: dict[str, bool] = {}  # repo -> success; tools sharing a repo
+    # Most used tools are updated first
+    for status in sort_statuses(get_snapshot().statuses, _usage):
+        if not status.needs_update:
+            continue
+        if status.repo in installed:
+            # Another tool from the same package - already installed with it
+            if installed[status.repo] and status.manifest.desktop_icon:
+                icon_batch.append((status.repo, status.manifest))
+            continue
+        key = f"install:{status.repo}"
+        if not breaker.allow(key):
+            continue
+        with breaker.attempt(key) as attempt:
+            success = install_tool(
+                status.repo,
+                status.manifest,
+                _token,
+                icon_batch,
+                status.remote,
+                interactive=True,
+            )
+            if not success:
+                attempt.fail()
+        installed[status.repo] = success
+    create_desktop_icons(icon_batch, _token)
+    refresh_orphans()
+    refresh_rollbacks()
+    refresh_in_background(force=True)
+    spawn_gc()
 
 
 def on_update_all(icon: Any, item: Any) -> None:
-    """Install/update all tools in background."""
-    threading.Thread(target=update_all, daemon=True).start()
+    """Install/update all tools in background (repeat clicks join the run)."""
+    threading.Thread(
+        target=lambda: single_flight("update_all", update_all), daemon=True
+    ).start()
 
 
 def make_cleanup_callback(orphans: list[OrphanedIcon]) -> Any:
@@ -265,11 +450,45 @@ def make_cleanup_callback(orphans: list[OrphanedIcon]) -> Any:
 
     def callback(icon: Any, item: Any) -> None:
         cleanup_orphans(orphans)
+        refresh_orphans()
+        notify_menu_changed()
+
+    return callback
+
+
+def make_rollback_callback(record: VersionRecord) -> Any:
+    """Create a callback that switches a tool back to a kept version."""
+
+    def run() -> None:
+        from tool_tray.logging import log_error
+
+        status = next(
+            (s for s in get_snapshot().statuses if s.repo == record.repo), None
+        )
+        if status is None:
+            return
+        if not rollback(record.repo, status.manifest, record.version):
+            log_error(f"Rollback failed: {record.repo} {record.version}")
+        refresh_rollbacks()
+        refresh_in_background(force=True)
+
+    def callback(icon: Any, item: Any) -> None:
+        threading.Thread(target=run, daemon=True).start()
 
     return callback
 
 
+def on_clear_manifest_cache(icon: Any, item: Any) -> None:
+    """Forget cached manifests and re-fetch them."""
+    from tool_tray.manifest import clear_manifest_cache
+
+    clear_manifest_cache()
+    refresh_in_background(force=True)
+
+
 def on_quit(icon: Any, item: Any) -> None:
+    cancel_refresh()
+    stop_supervisor()
     icon.stop()
 
 
@@ -282,13 +501,135 @@ def make_tool_callback(tool_name: str) -> Any:
     return callback
 
 
-def build_menu_items() -> list[Any]:
-    """Build menu items from current state. Called each time menu opens."""
-    # Reload config and statuses fresh each time menu opens
-    reload_config()
+def make_process_menu(tool_name: str) -> Any:
+    """Create the Focus/Restart/Kill submenu for a running tool."""
+
+    def on_focus(icon: Any, item: Any) -> None:
+        focus_process(tool_name)
+
+    def on_restart(icon: Any, item: Any) -> None:
+        restart_process(tool_name)
+
+    def on_kill(icon: Any, item: Any) -> None:
+        kill_process(tool_name)
+
+    return pystray.Menu(
+        pystray.MenuItem("Focus", on_focus),
+        pystray.MenuItem("Restart", on_restart),
+        pystray.MenuItem("Kill", on_kill),
+    )
+
+
+def runtime_text(tool_name: str) -> str:
+    """Process or autostart state suffix for a tool's menu entry."""
+    process = get_process(tool_name)
+    if process:
+        return f" ({process.hint})"
+    supervised = get_supervised(tool_name)
+    if supervised:
+        return f" [{supervised.state_text}]"
+    return ""
+
+
+def menu_key() -> tuple:
+    """Cheap fingerprint of everything the menu shows."""
+    snapshot = get_snapshot()
+    return (
+        bool(_token),
+        snapshot.version,
+        _menu_group,
+        _menu_sort,
+        tuple(_recent_tools),
+        tuple(_orphans),
+        tuple((r.repo, r.version) for r in _rollbacks),
+        tuple(runtime_text(s.name) for s in snapshot.statuses),
+        tuple((b.key, b.state) for b in breaker.open_breakers()),
+        tuple(get_install_progress().items()),
+    )
+
+
+def get_menu_items() -> list[Any]:
+    """Get menu items, rebuilding them only if the menu data changed."""
+    global _menu_cache
+
+    # Statuses revalidate in the background; never block the menu on them
+    changed = reload_config_if_changed()
+    if changed:
+        clear_pushed_at()  # Re-check every repo under the new config
     if _token:
-        refresh_statuses()
+        refresh_in_background(force=changed)
+
+    key = menu_key()
+    if _menu_cache is None or _menu_cache[0] != key:
+        _menu_cache = (key, build_menu_items())
+    return _menu_cache[1]
+
+
+def failing_text(repo: str) -> str:
+    """Menu suffix for repos whose fetches or installs keep failing."""
+    for op in ("fetch", "install"):
+        failing = breaker.get_breaker(f"{op}:{repo}")
+        if failing:
+            return f" ({failing.failing_text})"
+    return ""
+
+
+def tool_menu_item(status: ToolStatus) -> Any:
+    """Build the menu entry for one tool."""
+    text = status.display_text
+    if status.has_update:
+        text += " *"
+    text += runtime_text(status.name)
+    text += failing_text(status.repo)
+    progress = get_install_progress().get(status.repo)
+    if progress:
+        text += f" (installing: {progress})"
+    if get_process(status.name):
+        return pystray.MenuItem(f"> {text}", make_process_menu(status.name))
+    if status.can_launch:
+        return pystray.MenuItem(f"> {text}", make_tool_callback(status.name))
+    return pystray.MenuItem(text, None, enabled=False)
+
+
+def group_statuses(
+    statuses: tuple[ToolStatus, ...],
+) -> list[tuple[str, list[ToolStatus]]] | None:
+    """Group tools for submenus per the menu_group setting, or None for flat."""
+    mode = _menu_group
+    if mode == "auto":
+        mode = "status" if len(statuses) > _GROUP_THRESHOLD else "none"
+    if mode not in ("org", "category", "status"):
+        return None
+
+    groups: dict[str, list[ToolStatus]] = {}
+    if mode == "status":
+        # Fixed order: what needs attention first
+        for label in ("Updates Available", "Not Installed", "Up to Date"):
+            groups[label] = []
+        for s in statuses:
+            label = {
+                "outdated": "Updates Available",
+                "not_installed": "Not Installed",
+            }.get(s.state, "Up to Date")
+            groups[label].append(s)
+        return [(label, group) for label, group in groups.items() if group]
+
+    for s in statuses:
+        if mode == "org":
+            label = s.repo.split("/")[0]
+        else:
+            label = s.manifest.category or "Other"
+        groups.setdefault(label, []).append(s)
+    return sorted(groups.items(), key=lambda group: group[0].lower())
+
+
+def make_group_menu(statuses: list[ToolStatus]) -> Any:
+    """Create a submenu whose items are only built when it is opened."""
+    return pystray.Menu(lambda: (tool_menu_item(status) for status in statuses))
+
 
+def build_menu_items() -> list[Any]:
+    """Build menu items from current state."""
     items: list[Any] = []
 
     # Not configured state
@@ -299,28 +640,49 @@ def build_menu_items() -> list[Any]:
         items.append(pystray.MenuItem("Quit", on_quit))
         return items
 
-    # Configured state - show tools
-    for status in _tool_statuses:
-        text = status.display_text
-        if status.has_update:
-            text += " *"
-        if status.can_launch:
+    # Configured state - show tools from one consistent snapshot
+    statuses = get_snapshot().statuses
+    if _menu_sort == "usage":
+        statuses = tuple(sort_statuses(statuses, _usage))
+    if any(s.stale for s in statuses):
+        items.append(
+            pystray.MenuItem("(cached - checking for updates)", None, enabled=False)
+        )
+
+    groups = group_statuses(statuses)
+    if groups is None:
+        items.extend(tool_menu_item(status) for status in statuses)
+    else:
+        by_name = {s.name: s for s in statuses}
+        recent = [by_name[name] for name in _recent_tools if name in by_name]
+        if recent:
+            items.append(pystray.MenuItem("Recent:", None, enabled=False))
+            items.extend(tool_menu_item(status) for status in recent)
+            items.append(pystray.Menu.SEPARATOR)
+        for label, members in groups:
             items.append(
-                pystray.MenuItem(
-                    f"> {text}",
-                    make_tool_callback(status.name),
-                )
+                pystray.MenuItem(f"{label} ({len(members)})", make_group_menu(members))
             )
-        else:
-            items.append(pystray.MenuItem(text, None, enabled=False))
 
-    if not _tool_statuses:
+    # Repos that never loaded but keep failing - say so instead of hiding them
+    shown = {s.repo for s in statuses}
+    failing = [
+        b for b in breaker.open_breakers() if b.key.split(":", 1)[1] not in shown
+    ]
+    for b in failing:
+        items.append(
+            pystray.MenuItem(
+                f"[!] {b.key.split(':', 1)[1]} ({b.failing_text})", None, enabled=False
+            )
+        )
+
+    if not statuses and not failing:
         items.append(
             pystray.MenuItem("No tools with tooltray.toml", None, enabled=False)
         )
 
     # Show orphaned icons section if any exist
-    orphans = find_orphaned_icons()
+    orphans = _orphans
     if orphans:
         items.append(pystray.Menu.SEPARATOR)
         items.append(pystray.MenuItem("Orphaned Icons:", None, enabled=False))
@@ -344,7 +706,7 @@ def build_menu_items() -> list[Any]:
 
     items.append(pystray.Menu.SEPARATOR)
 
-    has_updates = any(s.has_update or not s.installed for s in _tool_statuses)
+    has_updates = any(s.needs_update for s in statuses)
     items.append(
         pystray.MenuItem(
             "Update All",
@@ -352,6 +714,24 @@ def build_menu_items() -> list[Any]:
             enabled=has_updates,
         )
     )
+    known = {s.repo for s in statuses}
+    rollbacks = [r for r in _rollbacks if r.repo in known]
+    if rollbacks:
+        items.append(
+            pystray.MenuItem(
+                "Roll Back",
+                pystray.Menu(
+                    *(
+                        pystray.MenuItem(
+                            f"Roll back {r.tool_name} to {r.version}",
+                            make_rollback_callback(r),
+                        )
+                        for r in rollbacks
+                    )
+                ),
+            )
+        )
+    items.append(pystray.MenuItem("Reload Manifests", on_clear_manifest_cache))
     items.append(pystray.MenuItem("Configure...", on_configure))
     items.append(pystray.Menu.SEPARATOR)
     items.append(pystray.MenuItem("Quit", on_quit))
@@ -360,14 +740,15 @@ def build_menu_items() -> list[Any]:
 
 
 def build_menu() -> Any:
-    """Build dynamic menu that rebuilds items each time it's opened."""
-    return pystray.Menu(lambda: iter(build_menu_items()))
+    """Build dynamic menu; items are cached until their data changes."""
+    return pystray.Menu(lambda: iter(get_menu_items()))
 
 
 def on_startup(icon: Any) -> None:
     """Called when tray icon is ready."""
     icon.visible = True
-    refresh_statuses()
+    refresh_in_background(force=True)
+    spawn_gc()
 
 
 def spawn_setup() -> None:
@@ -384,6 +765,28 @@ def spawn_setup() -> None:
     subprocess.Popen(cmd)
 
 
+def spawn_gc() -> None:
+    """Run garbage collection in a low-priority subprocess.
+
+    A separate process (rather than a thread) so the OS scheduler can run
+    the disk scan and deletions below the tray and the user's tools.
+    """
+    import shutil
+    import sys
+
+    from tool_tray.logging import log_error, log_info
+
+    tooltray_bin = shutil.which("tooltray") or sys.argv[0]
+    cmd, kwargs = low_priority([tooltray_bin, "gc", "--force"])
+    log_info(f"Spawning gc subprocess: {cmd}")
+    try:
+        subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **kwargs
+        )
+    except OSError as e:
+        log_error("Failed to start gc", e)
+
+
 def on_configure(icon: Any, item: Any) -> None:
     """Open setup dialog for configuration."""
     spawn_setup()
@@ -393,8 +796,9 @@ def run_tray() -> None:
     """Main entry point - create and run the tray icon."""
     from tool_tray import __version__
     from tool_tray.logging import log_info
+    from tool_tray.state import load_state, record_first_launch
 
-    global _icon
+    global _icon, _recent_tools, _usage
 
     log_info(f"Starting tooltray v{__version__}")
 
@@ -403,8 +807,17 @@ def run_tray() -> None:
         log_info("No config found, spawning setup")
         spawn_setup()
 
-    reload_config()
-    refresh_statuses()
+    # Show the last known statuses immediately; on_startup revalidates them
+    reload_config_if_changed()
+    active_repos = set(known_repos())
+    publish_statuses([s for s in load_status_snapshot() if s.repo in active_repos])
+    refresh_orphans()
+    refresh_rollbacks()
+    state = load_state()
+    _recent_tools = state.recent_tools
+    _usage = state.usage
+    set_startup_listener(record_first_launch)
+    set_progress_listener(on_install_progress)
 
     log_info("Tray icon starting")
     _icon = pystray.Icon(
@@ -0,0 +1,58 @@
+import time
+from collections.abc import Iterable
+from datetime import datetime
+
+from tool_tray.state import UsageRecord
+from tool_tray.status import ToolStatus
+
+_HALF_LIFE_DAYS: float = 14  # A launch counts half as much after this long
+_DORMANT_DAYS: float = 30  # Unused for this long: only checked occasionally
+_DORMANT_CHECK_SECONDS: int = 24 * 3600
+
+
+def _days_since(record: UsageRecord, now: float) -> float:
+    try:
+        last_used = datetime.fromisoformat(record.last_used).timestamp()
+    except ValueError:
+        return float("inf")
+    return max(0.0, now - last_used) / 86400
+
+
+def usage_score(record: UsageRecord | None, now: float | None = None) -> float:
+    """Launch count, decayed by how long ago the tool was last used."""
+    if record is None:
+        return 0.0
+    now = time.time() if now is None else now
+    return record.count * 0.5 ** (_days_since(record, now) / _HALF_LIFE_DAYS)
+
+
+def order_by_usage(repos: Iterable[str], usage: dict[str, UsageRecord]) -> list[str]:
+    """Most used repos first; ties keep their original order."""
+    now = time.time()
+    return sorted(repos, key=lambda repo: -usage_score(usage.get(repo), now))
+
+
+def sort_statuses(
+    statuses: Iterable[ToolStatus], usage: dict[str, UsageRecord]
+) -> list[ToolStatus]:
+    """Most used tools first; ties keep their original order."""
+    now = time.time()
+    return sorted(statuses, key=lambda s: -usage_score(usage.get(s.repo), now))
+
+
+def dormant_repos(
+    statuses: Iterable[ToolStatus], usage: dict[str, UsageRecord]
+) -> set[str]:
+    """Repos of long-unused tools that were checked recently enough to skip.
+
+    Tools never launched from tooltray are not considered dormant, since
+    there is no usage to judge them by.
+    """
+    now = time.time()
+    return {
+        s.repo
+        for s in statuses
+        if s.repo in usage
+        and _days_since(usage[s.repo], now) > _DORMANT_DAYS
+        and now - s.checked_at < _DORMANT_CHECK_SECONDS
+    }
@@ -0,0 +1,236 @@
+import json
+import threading
+import tomllib
+from collections.abc import Iterable
+
+import httpx
+from packaging.version import InvalidVersion, Version
+
+from tool_tray.github import API_URL, api_headers, expired, request_timeout
+
+VERSION_SOURCES: tuple[str, ...] = ("pyproject", "release", "tag", "commit")
+_BATCH_SIZE: int = 50  # Repos per GraphQL query
+_TAG_LIMIT: int = 100  # Most recent tags considered for "tag"
+
+
+def _parse(version: str) -> Version | None:
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+def _strip_tag(tag: str) -> str:
+    """Turn a tag like "v1.2.0" into "1.2.0"."""
+    if tag[:1] in ("v", "V") and tag[1:2].isdigit():
+        return tag[1:]
+    return tag
+
+
+def is_newer(remote: str, installed: str, source: str = "pyproject") -> bool:
+    """True if `remote` should replace `installed`.
+
+    Versions are compared per PEP 440, so downgrades and equal versions
+    spelled differently ("1.0" vs "1.0.0") are not updates. Commits and
+    unparseable versions fall back to plain inequality.
+    """
+    if source != "commit":
+        remote_version, installed_version = _parse(remote), _parse(installed)
+        if remote_version and installed_version:
+            return remote_version > installed_version
+    return remote != installed
+
+
+def latest_tag(names: Iterable[str]) -> str | None:
+    """Highest PEP 440 version among tag names (tags aren't listed in order)."""
+    best: tuple[Version, str] | None = None
+    for name in names:
+        text = _strip_tag(name)
+        version = _parse(text)
+        if version and (best is None or version > best[0]):
+            best = (version, text)
+    return best[1] if best else None
+
+
+def parse_pyproject_version(text: str) -> tuple[str | None, bool]:
+    """Read the version from pyproject.toml contents.
+
+    Returns (version, dynamic). `dynamic` is True when the version is computed
+    at build time (e.g. from git tags) and cannot be read from the file.
+
+    Raises:
+        tomllib.TOMLDecodeError: If the file is not valid TOML
+    """
+    data = tomllib.loads(text)
+    project = data.get("project", {})
+    if "version" in project.get("dynamic", []):
+        return None, True
+    version = project.get("version")
+    if version is None:
+        # Poetry projects without a [project] table
+        version = data.get("tool", {}).get("poetry", {}).get("version")
+    return version, False
+
+
+def get_remote_version(
+    repo: str, token: str, source: str = "pyproject", timeout: float = 10
+) -> str | None:
+    """Get the latest version of a repo, or None if it can't be determined."""
+    try:
+        return fetch_remote_version(repo, token, source, timeout)
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+def fetch_remote_version(
+    repo: str, token: str, source: str = "pyproject", timeout: float = 10
+) -> str | None:
+    """Get the latest version of a repo from the given version source.
+
+    pyproject: `version` from pyproject.toml, or the latest tag if dynamic
+    release: latest GitHub release tag
+    tag: highest version-like tag
+    commit: short SHA of the default branch tip
+
+    Returns None if the repo has no such version (e.g. no releases yet or
+    no pyproject.toml).
+
+    Raises:
+        httpx.HTTPError: If GitHub can't be reached or the request fails
+        ValueError: If the version source is unknown or a response is invalid
+    """
+    url = f"{API_URL}/repos/{repo}"
+    try:
+        if source == "pyproject":
+            resp = httpx.get(
+                f"{url}/contents/pyproject.toml",
+                headers=api_headers(token, "application/vnd.github.raw+json"),
+                timeout=timeout,
+            )
+            if resp.status_code == 404:
+                return None  # Not a Python project
+            resp.raise_for_status()
+            version, dynamic = parse_pyproject_version(resp.text)
+            if not dynamic:
+                return version
+            source = "tag"
+        if source == "release":
+            resp = httpx.get(
+                f"{url}/releases/latest", headers=api_headers(token), timeout=timeout
+            )
+            if resp.status_code == 404:
+                return None  # No releases yet
+            resp.raise_for_status()
+            return _strip_tag(resp.json()["tag_name"])
+        if source == "tag":
+            resp = httpx.get(
+                f"{url}/tags",
+                headers=api_headers(token),
+                params={"per_page": _TAG_LIMIT},
+                timeout=timeout,
+            )
+            resp.raise_for_status()
+            return latest_tag(tag["name"] for tag in resp.json())
+        if source == "commit":
+            resp = httpx.get(
+                f"{url}/commits/HEAD",
+                headers=api_headers(token, "application/vnd.github.sha"),
+                timeout=timeout,
+            )
+            resp.raise_for_status()
+            return resp.text.strip()[:7] or None
+    except (tomllib.TOMLDecodeError, KeyError) as e:
+        raise ValueError(f"Invalid response for {repo}: {e}") from e
+
+    raise ValueError(f"Unknown version_source: {source}")
+
+
+def _repo_query(alias: str, repo: str, source: str) -> str:
+    owner, name = repo.split("/", 1)
+    fields = []
+    if source == "pyproject":
+        fields.append(
+            'file: object(expression: "HEAD:pyproject.toml") { ... on Blob { text } }'
+        )
+    if source == "release":
+        fields.append("latestRelease { tagName }")
+    if source in ("tag", "pyproject"):
+        fields.append(
+            f'refs(refPrefix: "refs/tags/", first: {_TAG_LIMIT}, '
+            "orderBy: {field: TAG_COMMIT_DATE, direction: DESC}) { nodes { name } }"
+        )
+    if source == "commit":
+        fields.append("defaultBranchRef { target { oid } }")
+    return (
+        f"{alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+        f"{{ {' '.join(fields)} }}"
+    )
+
+
+def _version_from_node(node: dict, source: str) -> str | None:
+    if source == "pyproject":
+        text = (node.get("file") or {}).get("text")
+        if text is None:
+            return None
+        version, dynamic = parse_pyproject_version(text)
+        if not dynamic:
+            return version
+        source = "tag"
+    if source == "release":
+        release = node.get("latestRelease")
+        return _strip_tag(release["tagName"]) if release else None
+    if source == "tag":
+        return latest_tag(ref["name"] for ref in node["refs"]["nodes"])
+    if source == "commit":
+        branch = node.get("defaultBranchRef")
+        return branch["target"]["oid"][:7] if branch else None
+    return None
+
+
+def fetch_remote_versions(
+    sources: dict[str, str],
+    token: str,
+    deadline: float | None = None,
+    cancel: threading.Event | None = None,
+) -> dict[str, str | None]:
+    """Get remote versions for many repos with batched GraphQL queries.
+
+    `sources` maps repo -> version source. Repos missing from the result
+    could not be batched (request failed, or `deadline` passed or `cancel`
+    was set before their batch) and should be fetched one by one.
+    """
+    from tool_tray.logging import log_debug, log_error
+
+    items = [(r, s) for r, s in sources.items() if s in VERSION_SOURCES and "/" in r]
+    versions: dict[str, str | None] = {}
+    for start in range(0, len(items), _BATCH_SIZE):
+        if expired(deadline, cancel):
+            log_debug(f"Batched versions stopped early at {start}/{len(items)}")
+            break
+        batch = items[start : start + _BATCH_SIZE]
+        fields = " ".join(
+            _repo_query(f"r{i}", repo, source) for i, (repo, source) in enumerate(batch)
+        )
+        query = f"query {{ {fields} }}"
+        try:
+            resp = httpx.post(
+                f"{API_URL}/graphql",
+                headers=api_headers(token),
+                json={"query": query},
+                timeout=request_timeout(deadline),
+            )
+            resp.raise_for_status()
+            data = resp.json().get("data") or {}
+        except (httpx.HTTPError, ValueError) as e:
+            log_error("Batched version lookup failed", e)
+            continue
+        for i, (repo, source) in enumerate(batch):
+            node = data.get(f"r{i}")
+            if node is None:
+                continue  # Not found or not accessible - let the REST path decide
+            try:
+                versions[repo] = _version_from_node(node, source)
+            except (tomllib.TOMLDecodeError, KeyError, TypeError):
+                versions[repo] = None
+    log_debug(f"Batched versions: {len(versions)}/{len(items)} repos")
+    return versions
@@ -0,0 +1,235 @@
+import os
+import shutil
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+from tool_tray.manifest import Manifest
+from tool_tray.state import VersionRecord, load_state, record_version, remove_version
+
+_keep_versions: int = 2  # Previous versions kept per tool (0 disables rollback)
+_budget_bytes: int = 1024 * 1024 * 1024  # Total disk for kept versions
+
+
+def set_retention(keep: int, budget_mb: int) -> None:
+    """Configure how many previous versions are kept, and in how much disk."""
+    global _keep_versions, _budget_bytes
+    _keep_versions = max(0, keep)
+    _budget_bytes = max(0, budget_mb) * 1024 * 1024
+
+
+def get_versions_dir() -> Path:
+    """Get the directory previous versions are moved to."""
+    return Path.home() / ".local/share/tooltray/versions"
+
+
+def _live_path(repo: str, manifest: Manifest) -> Path | None:
+    """The environment or checkout an update would replace.
+
+    uv environments are looked up in uv's inventory, since the package name
+    need not match the manifest's name.
+    """
+    from tool_tray.updater import find_uv_tool, git_install_dir
+
+    if manifest.type == "git":
+        return git_install_dir(repo)
+    tool = find_uv_tool(manifest.package or manifest.launch or manifest.name)
+    return Path(tool.path) if tool and tool.path else None
+
+
+def _version_label(manifest: Manifest, live: Path) -> str | None:
+    """Installed version, or the short commit for checkouts without one."""
+    from tool_tray.updater import get_installed_version
+
+    version = get_installed_version(
+        manifest.package or manifest.launch or manifest.name
+    )
+    if version or manifest.type != "git":
+        return version
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=live,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip() or None
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def dir_size(path: Path) -> int:
+    """Bytes used by the files under a directory."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _copy_checkout(live: Path, target: Path) -> None:
+    """Copy a git checkout, hardlinking its .git directory.
+
+    git never modifies objects and replaces its other files by renaming,
+    so sharing them with the live checkout is safe. The working tree
+    (which may hold build output) is copied.
+    """
+    shutil.copytree(
+        live,
+        target,
+        symlinks=True,
+        ignore=lambda directory, names: [".git"] if Path(directory) == live else [],
+    )
+    shutil.copytree(
+        live / ".git", target / ".git", symlinks=True, copy_function=_link_or_copy
+    )
+
+
+def retain_version(
+    repo: str, manifest: Manifest, move: bool = False
+) -> VersionRecord | None:
+    """Set the installed version aside before it gets replaced.
+
+    uv environments are moved, not copied, so this is a rename on the same
+    disk. Moving one back to its original path later restores it as it
+    was, since the absolute paths inside it are valid again. git checkouts
+    are copied instead, so updates can still fetch into the live checkout,
+    unless `move` is set because a staged checkout is about to replace it.
+    """
+    from tool_tray.logging import log_error, log_info
+
+    if not _keep_versions:
+        return None
+    live = _live_path(repo, manifest)
+    if live is None or not live.exists():
+        return None
+    version = _version_label(manifest, live)
+    if not version:
+        return None
+
+    target = get_versions_dir() / live.name / version
+    try:
+        if target.exists():
+            shutil.rmtree(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if manifest.type == "git" and not move:
+            _copy_checkout(live, target)
+        else:
+            shutil.move(live, target)
+    except OSError as e:
+        if manifest.type == "git" and not move:
+            shutil.rmtree(target, ignore_errors=True)  # Partial copy
+        log_error(f"Failed to keep {repo} {version} for rollback", e)
+        return None
+
+    record = VersionRecord(
+        repo=repo,
+        tool_name=manifest.launch or manifest.name,
+        version=version,
+        kind=manifest.type,
+        path=str(target),
+        size=dir_size(target),
+        retained_at=datetime.now().isoformat(),
+        live_path=str(live),
+    )
+    record_version(record)
+    log_info(f"Kept {repo} {version} for rollback")
+    return record
+
+
+def restore_version(repo: str, manifest: Manifest, record: VersionRecord) -> bool:
+    """Move a kept version back into place, replacing what is there.
+
+    It goes back to the path it was kept from: a moved-out uv environment
+    is no longer in uv's inventory, so it can't be looked up again.
+    """
+    from tool_tray.logging import log_error, log_info
+
+    live = Path(record.live_path) if record.live_path else _live_path(repo, manifest)
+    if live is None or not Path(record.path).exists():
+        remove_version(record)
+        return False
+    try:
+        if live.exists():
+            shutil.rmtree(live)
+        shutil.move(record.path, live)
+    except OSError as e:
+        log_error(f"Failed to restore {repo} {record.version}", e)
+        return False
+    remove_version(record)
+    log_info(f"Restored {repo} {record.version}")
+    return True
+
+
+def get_versions(repo: str) -> list[VersionRecord]:
+    """Kept versions of a tool, newest first."""
+    return load_state().versions.get(repo, [])
+
+
+def rollback(repo: str, manifest: Manifest, version: str) -> bool:
+    """Switch back to a kept version without network access or a rebuild.
+
+    The version being replaced is itself kept, so a rollback can be undone.
+    """
+    from tool_tray.singleflight import single_flight
+
+    record = next((r for r in get_versions(repo) if r.version == version), None)
+    if record is None:
+        return False
+
+    def run() -> bool:
+        live = _live_path(repo, manifest)
+        if live and live.exists() and _version_label(manifest, live) == version:
+            return True  # Already on that version
+        retain_version(repo, manifest)
+        restored = restore_version(repo, manifest, record)
+        prune_versions()
+        return restored
+
+    # Shares the install key so a rollback never races an update
+    return single_flight(f"install:{repo}", run)
+
+
+def prune_versions() -> int:
+    """Drop kept versions beyond the per-tool count and the disk budget.
+
+    Returns the number of bytes freed. Oldest versions are evicted first.
+    """
+    from tool_tray.logging import log_info
+
+    keep: list[VersionRecord] = []
+    drop: list[VersionRecord] = []
+    for records in load_state().versions.values():
+        live = [r for r in records if Path(r.path).exists()]
+        drop += [r for r in records if r not in live]
+        keep += live[:_keep_versions]
+        drop += live[_keep_versions:]
+
+    keep.sort(key=lambda r: r.retained_at, reverse=True)
+    total = 0
+    for record in list(keep):
+        total += record.size
+        if total > _budget_bytes:
+            keep.remove(record)
+            drop.append(record)
+
+    freed = 0
+    for record in drop:
+        if Path(record.path).exists():
+            shutil.rmtree(record.path, ignore_errors=True)
+            freed += record.size
+        remove_version(record)
+    if drop:
+        log_info(f"Pruned {len(drop)} kept versions ({freed // (1024 * 1024)} MB)")
+    return freed
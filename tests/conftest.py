@@ -0,0 +1,46 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from tool_tray import breaker, manifest
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Isolated HOME, config and cache, and fresh in-memory caches."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(breaker, "_breakers", {})
+    monkeypatch.setattr(manifest, "_cache", None)
+    return tmp_path / "home"
+
+
+# Lists the environments under $FAKE_UV_TOOLS like `uv tool list --show-paths`,
+# with the version read from each environment's VERSION file
+FAKE_UV = """#!/bin/sh
+[ "$1 $2" = "tool list" ] || exit 1
+for env in "$FAKE_UV_TOOLS"/*; do
+    [ -d "$env" ] || continue
+    name=$(basename "$env")
+    echo "$name v$(cat "$env/VERSION") ($env)"
+    echo "- $name ($env/bin/$name)"
+done
+"""
+
+
+@pytest.fixture
+def tools_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A stub uv whose tool inventory is a directory."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    uv = bin_dir / "uv"
+    uv.write_text(FAKE_UV)
+    uv.chmod(uv.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    tools = tmp_path / "uv-tools"
+    tools.mkdir()
+    monkeypatch.setenv("FAKE_UV_TOOLS", str(tools))
+    return tools
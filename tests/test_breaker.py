@@ -0,0 +1,34 @@
+import pytest
+
+from tool_tray import breaker
+
+KEY = "fetch:acme/mytool"
+
+
+def _open() -> None:
+    for _ in range(3):
+        breaker.record_failure(KEY)
+    state = breaker._breakers[KEY]
+    state.opened_at -= state.cooldown  # Cool-down over: next call probes
+
+
+def test_probe_raising_reopens_breaker() -> None:
+    _open()
+    assert breaker.allow(KEY)
+    with pytest.raises(RuntimeError), breaker.attempt(KEY):
+        raise RuntimeError("unexpected")
+
+    assert breaker._breakers[KEY].state == "open"
+    assert not breaker.allow(KEY)
+
+
+def test_attempt_records_one_outcome() -> None:
+    with breaker.attempt(KEY) as attempt:
+        assert attempt.fail() == 1
+    assert breaker._breakers[KEY].failures == 1
+
+    _open()
+    assert breaker.allow(KEY)
+    with breaker.attempt(KEY):
+        pass
+    assert KEY not in breaker._breakers
@@ -0,0 +1,66 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from tool_tray import github, version_sources
+from tool_tray.discovery import iter_discovered_repos
+from tool_tray.repo_index import list_pushed_at
+
+
+@pytest.fixture
+def requests(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record requests; every listing page links to a next page."""
+    seen: list[str] = []
+
+    def get(url: str, **kwargs: object) -> httpx.Response:
+        seen.append(url)
+        return httpx.Response(
+            200,
+            json={"items": [{"repository": {"full_name": f"acme/r{len(seen)}"}}]},
+            headers={"link": f'<{url}?page={len(seen) + 1}>; rel="next"'},
+            request=httpx.Request("GET", url),
+        )
+
+    def post(url: str, **kwargs: object) -> httpx.Response:
+        seen.append(url)
+        return httpx.Response(
+            200, json={"data": {}}, request=httpx.Request("POST", url)
+        )
+
+    monkeypatch.setattr(github.httpx, "get", get)
+    monkeypatch.setattr(version_sources.httpx, "post", post)
+    return seen
+
+
+def test_iter_pages_stops_when_cancelled(requests: list[str]) -> None:
+    cancel = threading.Event()
+    pages = github.iter_pages(
+        f"{github.API_URL}/x", "token", items_key="items", cancel=cancel
+    )
+    next(pages)
+    next(pages)
+    cancel.set()
+    with pytest.raises(httpx.TimeoutException):
+        next(pages)
+    assert len(requests) == 2
+
+
+def test_discovery_stops_when_cancelled(requests: list[str]) -> None:
+    deadline = time.time() + 60
+    found = iter_discovered_repos(["acme"], "token", deadline=deadline)
+    assert next(found) == "acme/r1"
+
+    cancel = threading.Event()
+    cancel.set()
+    assert list(iter_discovered_repos(["acme"], "token", cancel=cancel)) == []
+    assert len(requests) == 1
+
+
+def test_listing_and_batches_skipped_past_deadline(requests: list[str]) -> None:
+    past = time.time() - 1
+    assert list_pushed_at(["acme/a", "other/b"], "token", deadline=past) == {}
+    sources = {f"acme/r{i}": "pyproject" for i in range(120)}
+    assert version_sources.fetch_remote_versions(sources, "token", past) == {}
+    assert requests == []
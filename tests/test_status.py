@@ -0,0 +1,62 @@
+import httpx
+import pytest
+
+from tool_tray import breaker, manifest
+from tool_tray.manifest import Manifest
+from tool_tray.status import ToolStatus, get_tool_statuses
+
+REPO = "acme/mytool"
+
+
+def _respond(monkeypatch: pytest.MonkeyPatch, status: int, **headers: str) -> None:
+    def get(url: str, **kwargs: object) -> httpx.Response:
+        return httpx.Response(
+            status, headers=headers, request=httpx.Request("GET", url)
+        )
+
+    monkeypatch.setattr(manifest.httpx, "get", get)
+
+
+def _previous() -> list[ToolStatus]:
+    return [
+        ToolStatus(
+            repo=REPO,
+            manifest=Manifest(name="mytool", type="uv"),
+            installed="1.0.0",
+            remote="1.0.0",
+            executable=None,
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "status,headers",
+    [(401, {}), (403, {}), (403, {"x-ratelimit-remaining": "0"})],
+)
+def test_denied_manifest_is_an_error(
+    monkeypatch: pytest.MonkeyPatch, status: int, headers: dict[str, str]
+) -> None:
+    _respond(monkeypatch, status, **headers)
+    errors: dict[str, str] = {}
+
+    statuses = get_tool_statuses(REPO, "token", _previous(), errors=errors)
+
+    assert [s.stale for s in statuses] == [True]
+    assert str(status) in errors[REPO]
+    assert ("rate limited" in errors[REPO]) == bool(headers)
+    assert breaker._breakers[f"fetch:{REPO}"].failures == 1
+
+    # Not cached: the next refresh asks GitHub again
+    _respond(monkeypatch, 404)
+    assert get_tool_statuses(REPO, "token", _previous()) == []
+
+
+def test_missing_manifest_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    _respond(monkeypatch, 404)
+    errors: dict[str, str] = {}
+
+    assert get_tool_statuses(REPO, "token", _previous(), errors=errors) == []
+    assert errors == {}
+
+    _respond(monkeypatch, 500)
+    assert manifest.load_manifests(REPO, "token") is None
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from tool_tray import storage
+from tool_tray.state import record_desktop_icon
+from tool_tray.versions import get_versions_dir
+
+
+def _make_dir(path: Path, size: int = 1000) -> Path:
+    path.mkdir(parents=True)
+    (path / "data").write_bytes(b"x" * size)
+    return path
+
+
+def test_unrecorded_installs_are_collected(
+    tools_dir: Path, home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    share = home / ".local/share/tooltray"
+    stale = _make_dir(share / "oldtool")
+    current = _make_dir(share / "mytool")
+    staging = _make_dir(share / ".staging/mytool")
+    orphan = _make_dir(get_versions_dir() / "mytool/1.0.0")
+    legacy_uv = _make_dir(tools_dir / "legacy")
+    (legacy_uv / "VERSION").write_text("1.0")
+    record_desktop_icon("legacy", "/desktop/legacy", "acme/legacy")
+
+    artefacts, live = storage.collect_artefacts(["acme/mytool"])
+
+    found = {Path(a.path): a.kind for a in artefacts}
+    assert found == {stale: "tool", orphan: "version", legacy_uv: "tool"}
+    assert current not in found and staging not in found
+    assert live == 1000
+
+    monkeypatch.setattr(storage, "_budget_bytes", 0)
+    evicted = storage.collect_garbage(["acme/mytool"]).evicted
+    assert {Path(a.path) for a in evicted} == set(found)
+    assert not stale.exists() and not orphan.exists() and current.exists()
+
+
+def test_unknown_repos_keep_unrecorded_checkouts(tools_dir: Path, home: Path) -> None:
+    checkout = _make_dir(home / ".local/share/tooltray/oldtool")
+
+    artefacts, live = storage.collect_artefacts(None)
+
+    assert artefacts == []
+    assert live == 1000
+    assert checkout.exists()
@@ -0,0 +1,129 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from tool_tray import staging, updater, versions
+from tool_tray.manifest import Manifest
+from tool_tray.state import load_state
+
+REPO = "acme/mytool"
+
+
+@pytest.fixture(autouse=True)
+def retention() -> None:
+    versions.set_retention(keep=2, budget_mb=1024)
+
+
+def _install_env(tools: Path, version: str) -> Path:
+    env = tools / "mytool"
+    env.mkdir()
+    (env / "VERSION").write_text(version)
+    return env
+
+
+def _manifest() -> Manifest:
+    return Manifest(name="My Tool", type="uv", launch="mytool", package="mytool")
+
+
+def test_failed_install_restores_kept_uv_env(
+    tools_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env = _install_env(tools_dir, "1.1.0")
+
+    def fail(*args: object) -> bool:
+        assert not env.exists()  # Moved aside while the install runs
+        return False
+
+    monkeypatch.setattr(updater, "_run_install", fail)
+    assert not updater._install_tool(REPO, _manifest(), "token")
+
+    assert (env / "VERSION").read_text() == "1.1.0"
+    assert updater.get_installed_version("mytool") == "1.1.0"
+    assert not any(versions.get_versions_dir().rglob("VERSION"))
+    assert load_state().versions == {}
+
+
+def test_install_raising_restores_kept_uv_env(
+    tools_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env = _install_env(tools_dir, "1.1.0")
+
+    def crash(*args: object) -> bool:
+        raise OSError("uv not found")
+
+    monkeypatch.setattr(updater, "_run_install", crash)
+    with pytest.raises(OSError):
+        updater._install_tool(REPO, _manifest(), "token")
+
+    assert (env / "VERSION").read_text() == "1.1.0"
+    assert load_state().versions == {}
+
+
+def test_rollback_swaps_uv_envs(
+    tools_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env = _install_env(tools_dir, "1.1.0")
+
+    def install(*args: object) -> bool:
+        _install_env(tools_dir, "1.2.0")
+        return True
+
+    monkeypatch.setattr(updater, "_run_install", install)
+    assert updater._install_tool(REPO, _manifest(), "token")
+    assert [r.version for r in versions.get_versions(REPO)] == ["1.1.0"]
+
+    assert versions.rollback(REPO, _manifest(), "1.1.0")
+    assert (env / "VERSION").read_text() == "1.1.0"
+    assert updater.get_installed_version("mytool") == "1.1.0"
+
+    # The replaced version is kept in turn, so the rollback can be undone
+    kept = versions.get_versions(REPO)
+    assert [r.version for r in kept] == ["1.2.0"]
+    assert (Path(kept[0].path) / "VERSION").read_text() == "1.2.0"
+    assert versions.rollback(REPO, _manifest(), "1.2.0")
+    assert (env / "VERSION").read_text() == "1.2.0"
+
+
+def _git_checkout(path: Path, content: str) -> None:
+    path.mkdir(parents=True)
+    (path / "tool.py").write_text(content)
+    for cmd in (
+        ["init", "-q"],
+        ["add", "."],
+        ["-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", content],
+    ):
+        subprocess.run(["git", *cmd], cwd=path, check=True)
+
+
+def test_staged_git_update_moves_live_checkout(
+    tools_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manifest = Manifest(name="mytool", type="git")
+    live = updater.git_install_dir(REPO)
+    _git_checkout(live, "v1")
+    inode = (live / "tool.py").stat().st_ino
+    staged = staging.get_staging_dir() / "mytool"
+    _git_checkout(staged, "v2")
+    staging._save_index(
+        {
+            REPO: staging.StagedUpdate(
+                repo=REPO,
+                version="2.0.0",
+                kind="git",
+                path=str(staged),
+                commit=None,
+                staged_at="2026-01-01T00:00:00",
+            )
+        }
+    )
+
+    def copy_checkout(*args: object) -> None:
+        raise AssertionError("staged switch must not copy the checkout")
+
+    monkeypatch.setattr(versions, "_copy_checkout", copy_checkout)
+    assert updater._install_tool(REPO, manifest, "token", "2.0.0")
+
+    assert (live / "tool.py").read_text() == "v2"
+    [kept] = versions.get_versions(REPO)
+    assert (Path(kept.path) / "tool.py").stat().st_ino == inode